@@ -26,6 +26,12 @@ class LiteEthMAC(LiteXModule):
         hw_mac             = None,
         timestamp          = None,
         full_memory_we     = False,
+        with_rx_dma        = False,
+        with_burst         = False,
+        with_shared_bus    = False,
+        with_bypass        = False,
+        bypass_depth       = None,
+        with_rx_descriptor = False,
         with_sys_datapath  = False,
         tx_cdc_depth       = 32,
         tx_cdc_buffered    = False,
@@ -35,6 +41,7 @@ class LiteEthMAC(LiteXModule):
         assert dw%8 == 0
         assert interface  in ["crossbar", "wishbone", "hybrid"]
         assert endianness in ["big", "little"]
+        assert not (with_rx_dma and dw < 16) # RX DMA writes the Length in a single word.
 
         # Core.
         # -----
@@ -69,20 +76,35 @@ class LiteEthMAC(LiteXModule):
             # ---------------------------------------------------
             self.rx_slots  = CSRConstant(nrxslots)
             self.tx_slots  = CSRConstant(ntxslots)
-            self.slot_size = CSRConstant(2**bits_for(eth_mtu))
             wishbone_interface = LiteEthMACWishboneInterface(
-                dw         = dw,
-                nrxslots   = nrxslots, rxslots_read_only  = rxslots_read_only,
-                ntxslots   = ntxslots, txslots_write_only = txslots_write_only,
-                endianness = endianness,
-                timestamp  = timestamp,
+                dw                 = dw,
+                nrxslots           = nrxslots, rxslots_read_only  = rxslots_read_only,
+                ntxslots           = ntxslots, txslots_write_only = txslots_write_only,
+                endianness         = endianness,
+                timestamp          = timestamp,
+                with_rx_dma        = with_rx_dma,
+                with_bypass        = with_bypass,
+                bypass_depth       = bypass_depth,
+                with_rx_descriptor = with_rx_descriptor,
+                with_burst         = with_burst,
+                with_shared_bus    = with_shared_bus,
             )
+            # Slot size (in bytes) is shared by RX/TX Slots, taken from the SRAM Writer/Reader strides.
+            rx_slot_words = wishbone_interface.sram.writer.slot_words
+            tx_slot_words = wishbone_interface.sram.reader.slot_words
+            assert rx_slot_words == tx_slot_words
+            self.slot_size = CSRConstant(rx_slot_words*dw//8)
             if full_memory_we:
                 wishbone_interface = self.apply_full_memory_we(wishbone_interface)
             self.interface = wishbone_interface
             self.ev        = self.interface.sram.ev
-            self.bus_rx    = self.interface.bus_rx
-            self.bus_tx    = self.interface.bus_tx
+            if with_shared_bus:
+                self.bus    = self.interface.bus
+            else:
+                self.bus_rx = self.interface.bus_rx
+                self.bus_tx = self.interface.bus_tx
+            if with_rx_dma:
+                self.bus_rx_dma = self.interface.rx_dma.bus
             self.csrs      = self.interface.get_csrs() + self.core.get_csrs()
 
             # Wishbone Mode.
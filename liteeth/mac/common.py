@@ -4,6 +4,9 @@
 # Copyright (c) 2015-2024 Florent Kermarrec <florent@enjoy-digital.fr>
 # SPDX-License-Identifier: BSD-2-Clause
 
+from functools import reduce
+from operator import add
+
 from liteeth.common import *
 from liteeth.crossbar import LiteEthCrossbar
 
@@ -83,3 +86,34 @@ class LiteEthLastHandler(LiteXModule):
                 NextState("COPY")
             )
         )
+
+# Last BE Decoder/Encoder --------------------------------------------------------------------------
+
+class LiteEthLastBEDecoder(LiteXModule):
+    def __init__(self, dw, last_be):
+        # Number of valid bytes of the last word (from one-hot last_be, full word when not set).
+        self.decoded = Signal(bits_for(dw//8))
+
+        # # #
+
+        # Set all bits up to the last_be one (last_be - 1 wraps to all ones when last_be is not set)
+        # and count them.
+        mask = Signal(dw//8)
+        self.comb += [
+            mask.eq((last_be - 1) | last_be),
+            self.decoded.eq(reduce(add, [mask[i] for i in range(dw//8)])),
+        ]
+
+
+class LiteEthLastBEEncoder(LiteXModule):
+    def __init__(self, dw, length_lsb):
+        # One-hot last_be (from the length LSBs, 0/full word mapping to the last byte).
+        self.encoded = Signal(dw//8)
+
+        # # #
+
+        shift = Signal(dw//8)
+        self.comb += [
+            shift.eq(1 << length_lsb),
+            self.encoded.eq(Cat(shift[1:], shift[0])),
+        ]
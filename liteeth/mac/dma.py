@@ -0,0 +1,135 @@
+#
+# This file is part of LiteEth.
+#
+# Copyright (c) 2026 agent <agent@local>
+# SPDX-License-Identifier: BSD-2-Clause
+
+from litex.gen import *
+
+from liteeth.common import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect import wishbone
+
+# MAC RX DMA ---------------------------------------------------------------------------------------
+
+class LiteEthMACRXDMA(LiteXModule):
+    """MAC RX DMA.
+
+    Copies the received packets from the MAC SRAM Writer Slots to a Ring Buffer in system memory,
+    avoiding the CPU copy of each packet out of the MAC SRAM.
+
+    Each Ring entry is slot_size bytes: The first word holds the packet length (written last, once
+    the packet data has been copied, so dw >= 16) and the packet data starts at the second word. Software
+    enables the DMA, consumes the entries up to head and advances tail to release them. The DMA
+    stays idle while ring_size is 0, so ring_size must be set before (or with) enable.
+
+    When the DMA is enabled, Slots are released in hardware and the Writer's available event
+    should no longer be handled (nor enabled) by software.
+    """
+    def __init__(self, dw, writer, address_width=32):
+        # Length is written in the first word of the Ring entries: Needs at least 16-bit.
+        assert dw >= 16, "RX DMA needs dw >= 16 (Packet Length in first word of Ring entries)."
+
+        self.bus      = wishbone.Interface(data_width=dw, address_width=address_width, addressing="word")
+        self.slot_bus = wishbone.Interface(data_width=dw)
+
+        # CSRs.
+        self._enable    = CSRStorage()
+        self._base      = CSRStorage(address_width)
+        self._ring_size = CSRStorage(16)
+        self._head      = CSRStatus(16)
+        self._tail      = CSRStorage(16)
+
+        # # #
+
+        bytes_per_word = dw//8
+        slot_words     = writer.mems[0].depth//writer.nslots # Slot stride of the Writer Memory.
+
+        enable  = self._enable.storage
+        head    = self._head.status
+        tail    = self._tail.storage
+        offset  = Signal(bits_for(slot_words))
+        count   = Signal(bits_for(slot_words*bytes_per_word))
+        data    = Signal(dw)
+
+        # Writer Status (Current Slot/Length are stable while available).
+        slot      = writer._slot.status
+        length    = writer._length.status
+        available = writer.ev.available.trigger
+
+        # Ring Head/Full.
+        head_next = Signal(16)
+        full      = Signal()
+        self.comb += [
+            If(head == (self._ring_size.storage - 1),
+                head_next.eq(0)
+            ).Else(
+                head_next.eq(head + 1)
+            ),
+            full.eq(head_next == tail),
+        ]
+
+        # Ring Entry Address (in words).
+        entry_adr = Signal(len(self.bus.adr))
+        self.comb += entry_adr.eq(
+            (self._base.storage >> log2_int(bytes_per_word)) +
+            (head << log2_int(slot_words))
+        )
+
+        # Common Bus signals.
+        self.comb += [
+            self.slot_bus.adr.eq((slot << log2_int(slot_words)) + offset),
+            self.slot_bus.sel.eq(2**bytes_per_word - 1),
+            self.bus.sel.eq(2**bytes_per_word - 1),
+        ]
+
+        # FSM.
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            NextValue(offset, 0),
+            NextValue(count,  0),
+            If(~enable,
+                NextValue(head, 0)
+            ),
+            # Ring not configured (ring_size == 0): Hold the DMA in IDLE.
+            If(enable & available & ~full & (self._ring_size.storage != 0),
+                NextState("READ")
+            )
+        )
+        fsm.act("READ",
+            self.slot_bus.stb.eq(1),
+            self.slot_bus.cyc.eq(1),
+            If(self.slot_bus.ack,
+                NextValue(data, self.slot_bus.dat_r),
+                NextState("WRITE-DATA")
+            )
+        )
+        fsm.act("WRITE-DATA",
+            self.bus.stb.eq(1),
+            self.bus.cyc.eq(1),
+            self.bus.we.eq(1),
+            self.bus.adr.eq(entry_adr + 1 + offset),
+            self.bus.dat_w.eq(data),
+            If(self.bus.ack,
+                NextValue(offset, offset + 1),
+                NextValue(count,  count + bytes_per_word),
+                If((count + bytes_per_word) >= length,
+                    NextState("WRITE-LENGTH")
+                ).Else(
+                    NextState("READ")
+                )
+            )
+        )
+        fsm.act("WRITE-LENGTH",
+            self.bus.stb.eq(1),
+            self.bus.cyc.eq(1),
+            self.bus.we.eq(1),
+            self.bus.adr.eq(entry_adr),
+            self.bus.dat_w.eq(length),
+            If(self.bus.ack,
+                writer.ack.eq(1),
+                NextValue(head, head_next),
+                NextState("IDLE")
+            )
+        )
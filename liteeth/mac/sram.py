@@ -12,6 +12,7 @@ import math
 from litex.gen import *
 
 from liteeth.common import *
+from liteeth.mac.common import LiteEthLastBEDecoder, LiteEthLastBEEncoder
 
 from litex.soc.interconnect.csr import *
 from litex.soc.interconnect.csr_eventmanager import *
@@ -19,15 +20,24 @@ from litex.soc.interconnect.csr_eventmanager import *
 # MAC SRAM Writer ----------------------------------------------------------------------------------
 
 class LiteEthMACSRAMWriter(LiteXModule):
-    def __init__(self, dw, depth, nslots=2, endianness="big", timestamp=None):
+    def __init__(self, dw, depth, nslots=2, endianness="big", timestamp=None, with_descriptor=False):
         # Endpoint / Signals.
         self.sink      = sink = stream.Endpoint(eth_phy_description(dw))
         self.crc_error = Signal()
+        self.ack       = Signal() # Optional Hardware release of the available Slot (ex from DMA).
+        self.drop      = Signal() # Optional Hardware packet drop, counted in errors (ex from Bypass).
 
         # Parameters Check / Compute.
-        assert dw in [8, 16, 32, 64]
-        slotbits   = max(int(math.log2(nslots)), 1)
+        assert dw in [8, 16, 32, 64, 128]
+        assert (nslots & (nslots - 1)) == 0 # Power of 2: Slot counter wraps on last slot.
+        slotbits   = bits_for(nslots - 1)
         lengthbits = bits_for(depth * dw//8)
+        bytebits   = log2_int(dw//8) # Byte offset bits in a word.
+        # Word address bits in a Slot: depth words + MTU overshoot word (written before the MTU
+        # check terminates the packet) + optional Descriptor word.
+        adrbits    = log2_int(depth + 1 + with_descriptor, need_pow2=False)
+        self.nslots     = nslots
+        self.slot_words = 2**adrbits
 
         # CSRs.
         self._slot   = CSRStatus(slotbits)
@@ -39,6 +49,15 @@ class LiteEthMACSRAMWriter(LiteXModule):
             timestampbits   = len(timestamp)
             self._timestamp = CSRStatus(timestampbits)
 
+        # Optional Descriptor: First word of each Slot is reserved for the packet length (and
+        # timestamp), packet data starting at the second word. This allows software to retrieve
+        # metadata and data in a single pass. The Descriptor is not written to the Slot (which would
+        # require an extra Memory write cycle between packets) but presented on desc for desc_slot
+        # and returned on bus reads of the first word of the Slot (see LiteEthMACWishboneInterface).
+        if with_descriptor:
+            assert 16 + (timestampbits if timestamp is not None else 0) <= dw, \
+                "RX Descriptor needs dw >= 16 + timestamp width (Length in [15:0], Timestamp from bit 16)."
+
         # Event Manager.
         self.ev           = EventManager()
         self.ev.available = EventSourceLevel()
@@ -46,128 +65,179 @@ class LiteEthMACSRAMWriter(LiteXModule):
 
         # # #
 
-        write   = Signal()
-        errors  = self._errors.status
+        write  = Signal()
+        drop   = Signal()
+        errors = self._errors.status
+
+        slot        = Signal(slotbits)
+        slot_ce     = Signal()
+        slot_wr     = Signal(log2_int(nslots) + 1)
+        slot_rd     = Signal(log2_int(nslots) + 1)
+        level       = Signal(log2_int(nslots) + 1)
+        length      = Signal(lengthbits)
+        length_last = Signal(lengthbits)
+        length_inc  = Signal(bits_for(dw//8))
+        mtu_reached = Signal()
 
-        slot       = Signal(slotbits)
-        length     = Signal(lengthbits)
-        length_inc = Signal(4)
+        drain_terminate = Signal()
 
-        # Sink is already ready: packets are dropped when no slot is available.
+        # Sink is always ready (packets are dropped when no slot is available).
         sink.ready.reset = 1
 
-        # Decode Length increment from from last_be.
-        self.comb += Case(sink.last_be, {
-            0b00000001 : length_inc.eq(1),
-            0b00000010 : length_inc.eq(2),
-            0b00000100 : length_inc.eq(3),
-            0b00001000 : length_inc.eq(4),
-            0b00010000 : length_inc.eq(5),
-            0b00100000 : length_inc.eq(6),
-            0b01000000 : length_inc.eq(7),
-            "default"  : length_inc.eq(dw//8)
-        })
-
-        # Status FIFO.
-        stat_fifo_layout = [("slot", slotbits), ("length", lengthbits)]
-        if timestamp is not None:
-            stat_fifo_layout += [("timestamp", timestampbits)]
-        self.stat_fifo = stat_fifo = stream.SyncFIFO(stat_fifo_layout, nslots)
+        # Decode Length increment from last_be.
+        self.last_be_decoder = LiteEthLastBEDecoder(dw, sink.last_be)
+        self.comb += length_inc.eq(self.last_be_decoder.decoded)
+
+        # Decode Error on last valid byte (Shared by WRITE/DRAIN states).
+        last_error = Signal()
+        self.comb += last_error.eq((sink.error & sink.last_be) != 0)
+
+        # Dropped packets Count.
+        self.sync += If(drop | self.drop, errors.eq(errors + 1))
+
+        # Slots Ring: Slots are filled by the FSM at slot_wr and released by software/DMA at slot_rd,
+        # in order. Pointers have an extra wrap bit to differentiate full/empty.
+        full  = Signal()
+        empty = Signal()
+        self.comb += [
+            level.eq(slot_wr - slot_rd),
+            full.eq(level == nslots),
+            empty.eq(level == 0),
+        ]
+        if nslots > 1:
+            self.comb += slot.eq(slot_wr[:slotbits])
+        self.sync += If(slot_ce, slot_wr.eq(slot_wr + 1))
+
+        # Slots Length (Stored on termination at slot_wr, presented to software at slot_rd).
+        lengths = Array(Signal(lengthbits) for _ in range(nslots))
+        self.sync += If(slot_ce, lengths[slot].eq(length_last))
+
+        # Termination: Release Slot with its Length.
+        def terminate(length_value):
+            return [
+                length_last.eq(length_value),
+                slot_ce.eq(1),
+                NextValue(length, 0),
+                NextValue(mtu_reached, 0),
+                NextState("WRITE"),
+            ]
 
         # FSM.
         self.fsm = fsm = FSM(reset_state="WRITE")
         fsm.act("WRITE",
             If(sink.valid,
-                If(stat_fifo.sink.ready,
+                If(~full,
                     write.eq(1),
-                    NextValue(length, length + length_inc),
-                    If(length >= eth_mtu,
-                         NextState("DISCARD-REMAINING")
+                    # Accumulate full words: Length is only completed with length_inc on termination,
+                    # keeping the last_be decode out of the accumulator path.
+                    NextValue(length, length + dw//8),
+                    # Registered MTU check: Evaluated one beat ahead on length (all beats but the
+                    # last one are full words) to keep the comparator out of the FSM path.
+                    NextValue(mtu_reached, length >= (eth_mtu - dw//8)),
+                    # MTU reached: Drain remaining words and terminate with truncated packet.
+                    If(mtu_reached,
+                        NextValue(drain_terminate, 1),
+                        NextState("DRAIN")
                     ),
                     If(sink.last,
-                        If((sink.error & sink.last_be) != 0,
-                            NextState("DISCARD")
+                        If(last_error,
+                            NextValue(length, 0),
+                            NextValue(mtu_reached, 0),
+                            NextState("WRITE")
                         ).Else(
-                            NextState("TERMINATE")
+                            # Terminate directly from the last beat so that back-to-back packets
+                            # are accepted without bubble (Slot is known to be free here).
+                            *terminate(length + length_inc)
                         )
                     )
                 ).Else(
-                    NextValue(errors, errors + 1),
-                    NextState("DISCARD-ALL")
-                )
-            )
-        )
-        fsm.act("DISCARD-REMAINING",
-            If(sink.valid & sink.last,
-                If((sink.error & sink.last_be) != 0,
-                    NextState("DISCARD")
-                ).Else(
-                    NextState("TERMINATE")
+                    # No Slot available: Drop packet (Drain remaining words if not last).
+                    drop.eq(1),
+                    If(~sink.last,
+                        NextValue(drain_terminate, 0),
+                        NextState("DRAIN")
+                    )
                 )
             )
         )
-        fsm.act("DISCARD-ALL",
+        fsm.act("DRAIN",
             If(sink.valid & sink.last,
-                If((sink.last_be) != 0,
-                    NextState("DISCARD")
+                If(drain_terminate & ~last_error,
+                    *terminate(length)
                 ).Else(
                     NextValue(length, 0),
+                    NextValue(mtu_reached, 0),
                     NextState("WRITE")
                 )
             )
         )
-        fsm.act("DISCARD",
-            NextValue(length, 0),
-            NextState("WRITE")
-        )
-        fsm.act("TERMINATE",
-            stat_fifo.sink.valid.eq(1),
-            stat_fifo.sink.slot.eq(slot),
-            stat_fifo.sink.length.eq(length),
-            NextValue(length, 0),
-            NextValue(slot, slot + 1),
-            NextState("WRITE")
-        )
 
+        # Release Slot on software clear (or hardware ack) and expose the oldest filled Slot.
+        rd_slot = slot_rd[:slotbits] if nslots > 1 else 0
+        self.sync += If((self.ev.available.clear | self.ack) & ~empty, slot_rd.eq(slot_rd + 1))
         self.comb += [
-            stat_fifo.source.ready.eq(self.ev.available.clear),
-            self.ev.available.trigger.eq(stat_fifo.source.valid),
-            self._slot.status.eq(stat_fifo.source.slot),
-            self._length.status.eq(stat_fifo.source.length),
+            self.ev.available.trigger.eq(~empty),
+            self._length.status.eq(lengths[rd_slot]),
         ]
+        if nslots > 1:
+            self.comb += self._slot.status.eq(rd_slot)
         if timestamp is not None:
-            # Latch Timestamp on start of packet.
-            self.sync += If(length == 0, stat_fifo.sink.timestamp.eq(timestamp))
-            self.comb += self._timestamp.status.eq(stat_fifo.source.timestamp)
+            # Store Timestamp in a small RAM indexed by Slot, written on first word of packet (Slot
+            # is known to be free when accepted) and read back with the exposed Slot.
+            ts_mem    = Memory(timestampbits, nslots, name="rx_timestamp_mem")
+            ts_wrport = ts_mem.get_port(write_capable=True)
+            ts_rdport = ts_mem.get_port(async_read=True)
+            self.specials += ts_mem, ts_wrport, ts_rdport
+            self.comb += [
+                ts_wrport.adr.eq(slot),
+                ts_wrport.dat_w.eq(timestamp),
+                ts_wrport.we.eq(write & (length == 0)),
+                ts_rdport.adr.eq(rd_slot),
+                self._timestamp.status.eq(ts_rdport.dat_r),
+            ]
+
+        # Descriptor (Length/Timestamp of desc_slot).
+        if with_descriptor:
+            self.desc_slot = Signal(slotbits)
+            self.desc      = Signal(dw)
+            desc_slot = self.desc_slot if nslots > 1 else 0
+            self.comb += self.desc[:lengthbits].eq(lengths[desc_slot])
+            if timestamp is not None:
+                ts_descport = ts_mem.get_port(async_read=True)
+                self.specials += ts_descport
+                self.comb += ts_descport.adr.eq(desc_slot)
+                self.comb += self.desc[16:16 + timestampbits].eq(ts_descport.dat_r)
 
         # Memory.
         wr_slot = slot
-        wr_addr = length[int(math.log2(dw//8)):]
-        wr_data = Signal(len(sink.data))
-
-        # Create a Memory per Slot.
-        mems  = [None] * nslots
-        ports = [None] * nslots
-        for n in range(nslots):
-            mems[n]  = Memory(dw, depth)
-            ports[n] = mems[n].get_port(write_capable=True)
-            self.specials += ports[n]
-        self.mems = mems
-
-        # Endianness Handling.
-        self.comb += wr_data.eq({"big": reverse_bytes(sink.data), "little": sink.data}[endianness])
-
-        # Connect Memory ports.
-        cases = {}
-        for n, port in enumerate(ports):
-            cases[n] = [
-                ports[n].adr.eq(wr_addr),
-                ports[n].dat_w.eq(wr_data),
-                If(sink.valid & write,
-                    ports[n].we.eq(2**len(ports[n].we) - 1)
-                )
-            ]
-        self.comb += Case(wr_slot, cases)
+        wr_addr = Signal(adrbits)
+        wr_be   = Signal(dw//8, reset=2**(dw//8) - 1)
+        self.comb += wr_addr.eq(length[bytebits:] + with_descriptor)
+
+        # Create a single Memory for all Slots, Slot being used as MSBs of the address (Named to ease
+        # RAM style constraints, ex URAM/M20K, in the build).
+        mem  = Memory(dw, 2**adrbits*nslots, name="rx_slots_mem")
+        port = mem.get_port(write_capable=True, we_granularity=8, has_re=True)
+        self.specials += port
+        self.mems = [mem]
+
+        # Byte Write Enable: Only write the valid bytes of the last word (bytes after last_be).
+        for i in range(1, dw//8):
+            self.comb += If(sink.last & (sink.last_be[:i] != 0), wr_be[i].eq(0))
+
+        # Endianness Handling (Byte lanes swap of Data and Byte Write Enable, only wiring).
+        wr_data = {"big": reverse_bytes(sink.data), "little": sink.data}[endianness]
+        wr_we   = {"big": reverse_bits(wr_be),      "little": wr_be}[endianness]
+
+        # Connect Memory port.
+        self.comb += [
+            port.adr.eq(Cat(wr_addr, wr_slot) if nslots > 1 else wr_addr),
+            port.dat_w.eq(wr_data),
+            # Write is only asserted on accepted (valid) words.
+            port.we.eq(Replicate(write, dw//8) & wr_we),
+            # Read side is unused: Only enable port on writes to avoid useless toggling when idle.
+            port.re.eq(write),
+        ]
 
 # MAC SRAM Reader ----------------------------------------------------------------------------------
 
@@ -177,14 +247,19 @@ class LiteEthMACSRAMReader(LiteXModule):
         self.source = source = stream.Endpoint(eth_phy_description(dw))
 
         # Parameters Check / Compute.
-        assert dw in [8, 16, 32, 64]
-        slotbits   = max(int(math.log2(nslots)), 1)
+        assert dw in [8, 16, 32, 64, 128]
+        assert (nslots & (nslots - 1)) == 0 # Power of 2: Slot counter wraps on last slot.
+        slotbits   = bits_for(nslots - 1)
         lengthbits = bits_for(depth * dw//8)
+        bytebits   = log2_int(dw//8)                    # Byte offset bits in a word.
+        adrbits    = log2_int(depth, need_pow2=False)   # Word address bits in a Slot.
+        self.nslots     = nslots
+        self.slot_words = 2**adrbits
 
         # CSRs.
         self._start  = CSR()
         self._ready  = CSRStatus()
-        self._level  = CSRStatus(int(math.log2(nslots)) + 1)
+        self._level  = CSRStatus(bits_for(nslots))
         self._slot   = CSRStorage(slotbits,   reset_less=True)
         self._length = CSRStorage(lengthbits, reset_less=True)
 
@@ -202,109 +277,261 @@ class LiteEthMACSRAMReader(LiteXModule):
         # # #
 
         read   = Signal()
+        last   = Signal()
         length = Signal(lengthbits)
 
-        # Command FIFO.
-        cmd_fifo = stream.SyncFIFO([("slot", slotbits), ("length", lengthbits)], nslots)
-        self.submodules += cmd_fifo
+        # Commands Ring: Commands (Slot/Length) are pushed by software at head and consumed by the
+        # FSM at tail, in order. Pointers have an extra wrap bit to differentiate full/empty.
+        head        = Signal(log2_int(nslots) + 1)
+        tail        = Signal(log2_int(nslots) + 1)
+        level       = Signal(log2_int(nslots) + 1)
+        cmd_valid   = Signal()
+        cmd_ready   = Signal()
+        cmd_slot    = Signal(slotbits)
+        cmd_length  = Signal(lengthbits)
+        cmd_slots   = Array(Signal(slotbits)   for _ in range(nslots))
+        cmd_lengths = Array(Signal(lengthbits) for _ in range(nslots))
+        head_idx    = head[:slotbits] if nslots > 1 else 0
+        tail_idx    = tail[:slotbits] if nslots > 1 else 0
         self.comb += [
-            cmd_fifo.sink.valid.eq(self._start.re),
-            cmd_fifo.sink.slot.eq(self._slot.storage),
-            cmd_fifo.sink.length.eq(self._length.storage),
-            self._ready.status.eq(cmd_fifo.sink.ready),
-            self._level.status.eq(cmd_fifo.level)
+            level.eq(head - tail),
+            cmd_valid.eq(level != 0),
+            cmd_slot.eq(cmd_slots[tail_idx]),
+            cmd_length.eq(cmd_lengths[tail_idx]),
+            self._ready.status.eq(level != nslots),
+            self._level.status.eq(level),
+        ]
+        self.sync += [
+            If(self._start.re & self._ready.status,
+                cmd_slots[head_idx].eq(self._slot.storage),
+                cmd_lengths[head_idx].eq(self._length.storage),
+                head.eq(head + 1)
+            ),
+            If(cmd_ready,
+                tail.eq(tail + 1)
+            )
         ]
-
-        # Status FIFO (Only added when Timestamping).
-        if timestamp is not None:
-            stat_fifo_layout = [("slot", slotbits), ("timestamp", timestampbits)]
-            stat_fifo = stream.SyncFIFO(stat_fifo_layout, nslots)
-            self.submodules += stat_fifo
-            self.comb += stat_fifo.source.ready.eq(self.ev.done.clear)
-            self.comb += self._timestamp_slot.status.eq(stat_fifo.source.slot)
-            self.comb += self._timestamp.status.eq(stat_fifo.source.timestamp)
 
         # Encode Length to last_be.
-        length_lsb = cmd_fifo.source.length[:int(math.log2(dw/8))] if (dw != 8) else 0
-        self.comb += If(source.last,
-            Case(length_lsb, {
-                1         : source.last_be.eq(0b00000001),
-                2         : source.last_be.eq(0b00000010),
-                3         : source.last_be.eq(0b00000100),
-                4         : source.last_be.eq(0b00001000),
-                5         : source.last_be.eq(0b00010000),
-                6         : source.last_be.eq(0b00100000),
-                7         : source.last_be.eq(0b01000000),
-                "default" : source.last_be.eq(2**(dw//8 - 1)),
-            })
-        )
+        length_lsb = cmd_length[:bytebits] if (dw != 8) else 0
+        self.last_be_encoder = LiteEthLastBEEncoder(dw, length_lsb)
+        self.comb += If(source.last, source.last_be.eq(self.last_be_encoder.encoded))
 
         # FSM.
         self.fsm = fsm = FSM(reset_state="IDLE")
         fsm.act("IDLE",
-            If(cmd_fifo.source.valid,
+            If(cmd_valid,
                 read.eq(1),
                 NextValue(length, dw//8),
+                NextValue(last, cmd_length <= dw//8),
                 NextState("READ")
             )
         )
         fsm.act("READ",
             source.valid.eq(1),
-            source.last.eq(length >= cmd_fifo.source.length),
+            source.last.eq(last),
             If(source.ready,
                 read.eq(1),
                 NextValue(length, length + dw//8),
+                # Registered Last check: Evaluated one word ahead to keep the comparator out of the
+                # source.last/FSM path.
+                NextValue(last, (length + dw//8) >= cmd_length),
                 If(source.last,
+                    # Release Command on last word: Next Command (if any) is then presented in
+                    # TERMINATE and directly started, without returning to IDLE.
+                    cmd_ready.eq(1),
+                    NextValue(length, 0),
                     NextState("TERMINATE")
                 )
             )
         )
         fsm.act("TERMINATE",
-            NextValue(length, 0),
             self.ev.done.trigger.eq(1),
-            cmd_fifo.source.ready.eq(1),
-            NextState("IDLE")
+            If(cmd_valid,
+                read.eq(1),
+                NextValue(length, dw//8),
+                NextValue(last, cmd_length <= dw//8),
+                NextState("READ")
+            ).Else(
+                NextState("IDLE")
+            )
         )
 
+        # Status Ring (Only added when Timestamping): Slot/Timestamp of the sent packets, pushed on
+        # last word and released on software clear. Pointers have an extra wrap bit (as Commands).
         if timestamp is not None:
-            # Latch Timestamp on start of outgoing packet.
-            self.sync += If(length == 0, stat_fifo.sink.timestamp.eq(timestamp))
-            self.comb += stat_fifo.sink.valid.eq(fsm.ongoing("END"))
-            self.comb += stat_fifo.sink.slot.eq(cmd_fifo.source.slot)
-            # Trigger event when Status FIFO has contents (Override FSM assignment).
-            self.comb += self.ev.done.trigger.eq(stat_fifo.source.valid)
+            stat_wr         = Signal(log2_int(nslots) + 1)
+            stat_rd         = Signal(log2_int(nslots) + 1)
+            stat_level      = Signal(log2_int(nslots) + 1)
+            stat_slots      = Array(Signal(slotbits)      for _ in range(nslots))
+            stat_timestamps = Array(Signal(timestampbits) for _ in range(nslots))
+            stat_timestamp  = Signal(timestampbits)
+            stat_wr_idx     = stat_wr[:slotbits] if nslots > 1 else 0
+            stat_rd_idx     = stat_rd[:slotbits] if nslots > 1 else 0
+            self.comb += stat_level.eq(stat_wr - stat_rd)
+            self.sync += [
+                # Latch Timestamp on start of outgoing packet (once per packet: A Command is started
+                # when presented outside of READ).
+                If(~fsm.ongoing("READ") & cmd_valid,
+                    stat_timestamp.eq(timestamp)
+                ),
+                # Push Status on last word (Command/Slot is released at the end of this cycle).
+                If(source.valid & source.ready & source.last & (stat_level != nslots),
+                    stat_slots[stat_wr_idx].eq(cmd_slot),
+                    stat_timestamps[stat_wr_idx].eq(stat_timestamp),
+                    stat_wr.eq(stat_wr + 1)
+                ),
+                If(self.ev.done.clear & (stat_level != 0),
+                    stat_rd.eq(stat_rd + 1)
+                )
+            ]
+            self.comb += [
+                self._timestamp_slot.status.eq(stat_slots[stat_rd_idx]),
+                self._timestamp.status.eq(stat_timestamps[stat_rd_idx]),
+                # Trigger event when Status Ring has contents (Override FSM assignment).
+                self.ev.done.trigger.eq(stat_level != 0),
+            ]
 
         # Memory.
-        rd_slot = cmd_fifo.source.slot
-        rd_addr = Signal(lengthbits)
-        rd_data = Signal(len(source.data))
-
-        # Create a Memory per Slot.
-        mems    = [None]*nslots
-        ports   = [None]*nslots
-        for n in range(nslots):
-            mems[n]  = Memory(dw, depth)
-            ports[n] = mems[n].get_port(has_re=True, mode=READ_FIRST)
-            self.specials += ports[n]
-        self.mems = mems
-
-        # Connect Memory ports.
-        cases = {}
-        for n, port in enumerate(ports):
-            self.comb += port.re.eq(read)
-            self.comb += port.adr.eq(length[int(math.log2(dw//8)):])
-            cases[n] = [rd_data.eq(port.dat_r)]
-
-        self.comb += Case(rd_slot, cases)
-
-        # Endianness Handling.
-        self.comb += source.data.eq({"big" : reverse_bytes(rd_data), "little": rd_data}[endianness])
+        rd_slot = cmd_slot if nslots > 1 else 0
+        rd_addr = length[bytebits:][:adrbits]
+
+        # Create a single Memory for all Slots, Slot being used as MSBs of the address (Named to ease
+        # RAM style constraints, ex URAM/M20K, in the build).
+        mem  = Memory(dw, 2**adrbits*nslots, name="tx_slots_mem")
+        port = mem.get_port(has_re=True, mode=READ_FIRST)
+        self.specials += port
+        self.mems = [mem]
+
+        # Connect Memory port.
+        self.comb += [
+            port.re.eq(read),
+            port.adr.eq(Cat(rd_addr, rd_slot) if nslots > 1 else rd_addr),
+        ]
+
+        # Endianness Handling (Byte lanes swap, only wiring).
+        self.comb += source.data.eq({"big" : reverse_bytes(port.dat_r), "little": port.dat_r}[endianness])
 
 # MAC SRAM -----------------------------------------------------------------------------------------
 
 class LiteEthMACSRAM(LiteXModule):
-    def __init__(self, dw, depth, nrxslots, ntxslots, endianness, timestamp=None):
-        self.writer = LiteEthMACSRAMWriter(dw, depth, nrxslots, endianness, timestamp)
+    """MAC SRAM
+
+    RX Slots (Writer) / TX Slots (Reader) in SRAM, with optional Bypass.
+
+    Parameters
+    ----------
+    with_bypass : bool
+        Add a software controlled Bypass forwarding incoming packets directly to the output. Since
+        the sink is never stalled, the Bypass FIFO has to hold at least a full MTU packet: it costs
+        bypass_depth words of dw + control bits of RAM in addition to the Slots, ex 766 words by
+        default at dw=32 (2 MTU packets) or 3060 words at dw=8.
+    bypass_depth : int
+        Bypass FIFO depth in words (default: 2 MTU packets, minimum: 1 MTU packet). With a single
+        MTU packet, a packet is only accepted once the previous one has been fully sent.
+    with_rx_descriptor : bool
+        Reserve the first word of each RX Slot for a Descriptor (Length/Timestamp).
+    """
+    def __init__(self, dw, depth, nrxslots, ntxslots, endianness, timestamp=None,
+        with_bypass        = False,
+        bypass_depth       = None,
+        with_rx_descriptor = False,
+    ):
+        self.writer = LiteEthMACSRAMWriter(dw, depth, nrxslots, endianness, timestamp,
+            with_descriptor = with_rx_descriptor,
+        )
         self.reader = LiteEthMACSRAMReader(dw, depth, ntxslots, endianness, timestamp)
         self.ev     = SharedIRQ(self.writer.ev, self.reader.ev)
-        self.sink, self.source = self.writer.sink, self.reader.source
+        self.mems   = self.writer.mems + self.reader.mems
+        if not with_bypass:
+            self.sink, self.source = self.writer.sink, self.reader.source
+        else:
+            self.add_bypass(dw, depth=bypass_depth)
+
+    def add_bypass(self, dw, depth=None):
+        # Bypass: When enabled by software, incoming packets are forwarded directly to the output
+        # (cut-through) instead of being written to the Slots, ex for internal forwarding.
+        self.sink   = sink   = stream.Endpoint(eth_phy_description(dw))
+        self.source = source = stream.Endpoint(eth_phy_description(dw))
+        self._bypass = CSRStorage()
+
+        # # #
+
+        # Bypass FIFO: Sink can't be stalled (as for the Writer), so packets are only accepted when
+        # the FIFO has room for a full MTU packet. By default, room for two packets is provided
+        # so that one packet can be received while the previous one is sent.
+        mtu_words = math.ceil(eth_mtu/(dw//8))
+        if depth is None:
+            depth = 2*mtu_words
+        assert depth >= mtu_words, "Bypass FIFO must hold at least a full MTU packet."
+        self.bypass_fifo = bypass_fifo = stream.SyncFIFO(eth_phy_description(dw), depth)
+
+        # Input: Bypass selection only updated on packet boundaries.
+        first      = Signal(reset=1)
+        bypass     = Signal()
+        bypass_sel = Signal()
+        drop       = Signal()
+        drop_sel   = Signal()
+        words      = Signal(max=mtu_words)
+        truncate   = Signal()
+        self.sync += [
+            If(sink.valid & sink.ready,
+                first.eq(sink.last),
+                If(first,
+                    bypass.eq(self._bypass.storage)
+                ),
+                If(sink.last,
+                    drop.eq(0),
+                    words.eq(0)
+                ).Else(
+                    # Drop the remaining words of dropped/truncated packets.
+                    drop.eq(drop_sel | truncate),
+                    words.eq(words + 1)
+                )
+            )
+        ]
+        self.comb += [
+            bypass_sel.eq(Mux(first, self._bypass.storage, bypass)),
+            # Drop packet when starting without room in the FIFO for a full MTU packet.
+            drop_sel.eq(Mux(first, bypass_fifo.level > (depth - mtu_words), drop)),
+            # Truncate packet on MTU (as done by the Writer).
+            truncate.eq(words == (mtu_words - 1)),
+            If(bypass_sel,
+                If(drop_sel,
+                    sink.ready.eq(1),
+                    self.writer.drop.eq(sink.valid & first),
+                ).Else(
+                    sink.connect(bypass_fifo.sink),
+                    If(truncate,
+                        bypass_fifo.sink.last.eq(1),
+                        If(~sink.last,
+                            bypass_fifo.sink.last_be.eq(2**(dw//8 - 1))
+                        )
+                    )
+                )
+            ).Else(
+                sink.connect(self.writer.sink)
+            )
+        ]
+
+        # Output: Arbitrate Reader/Bypass FIFO on packet boundaries.
+        self.bypass_fsm = bypass_fsm = FSM(reset_state="IDLE")
+        bypass_fsm.act("IDLE",
+            If(self.reader.source.valid,
+                NextState("READER")
+            ).Elif(bypass_fifo.source.valid,
+                NextState("BYPASS")
+            )
+        )
+        bypass_fsm.act("READER",
+            self.reader.source.connect(source),
+            If(source.valid & source.ready & source.last,
+                NextState("IDLE")
+            )
+        )
+        bypass_fsm.act("BYPASS",
+            bypass_fifo.source.connect(source),
+            If(source.valid & source.ready & source.last,
+                NextState("IDLE")
+            )
+        )
@@ -12,6 +12,7 @@ from litex.gen import *
 
 from liteeth.common import *
 from liteeth.mac import sram
+from liteeth.mac.dma import LiteEthMACRXDMA
 
 from litex.soc.interconnect import wishbone
 
@@ -21,62 +22,86 @@ class LiteEthMACWishboneInterface(LiteXModule):
     def __init__(self, dw, nrxslots=2, ntxslots=2, endianness="big", timestamp=None,
         rxslots_read_only  = True,
         txslots_write_only = False,
+        with_rx_dma        = False,
+        with_bypass        = False,
+        bypass_depth       = None,
+        with_rx_descriptor = False,
+        with_burst         = False,
+        with_shared_bus    = False,
     ):
         self.sink   = stream.Endpoint(eth_phy_description(dw))
         self.source = stream.Endpoint(eth_phy_description(dw))
-        self.bus_rx = wishbone.Interface(data_width=dw)
-        self.bus_tx = wishbone.Interface(data_width=dw)
+        bus_rx      = wishbone.Interface(data_width=dw, bursting=with_burst)
+        bus_tx      = wishbone.Interface(data_width=dw, bursting=with_burst)
+        # RX/TX Slots buses are only exposed through a single bus when with_shared_bus.
+        if with_shared_bus:
+            self.bus = wishbone.Interface(data_width=dw, bursting=with_burst)
+        else:
+            self.bus_rx = bus_rx
+            self.bus_tx = bus_tx
 
         # # #
 
         # Storage in SRAM.
         # ----------------
         sram_depth = math.ceil(eth_mtu/(dw//8))
-        self.sram = sram.LiteEthMACSRAM(dw, sram_depth, nrxslots, ntxslots, endianness, timestamp)
+        self.sram = sram.LiteEthMACSRAM(dw, sram_depth, nrxslots, ntxslots, endianness, timestamp,
+            with_bypass        = with_bypass,
+            bypass_depth       = bypass_depth,
+            with_rx_descriptor = with_rx_descriptor,
+        )
         self.comb += [
             self.sink.connect(self.sram.sink),
             self.sram.source.connect(self.source),
         ]
 
+        # Optional RX DMA (Shares the RX Slots with the CPU).
+        # ---------------------------------------------------
+        sram_bus_rx = bus_rx
+        if with_rx_dma:
+            assert not with_rx_descriptor # DMA copies Slots from their start.
+            sram_bus_rx = wishbone.Interface(data_width=dw, bursting=with_burst)
+            self.rx_dma = LiteEthMACRXDMA(dw, self.sram.writer)
+            self.rx_dma_arbiter = wishbone.Arbiter([bus_rx, self.rx_dma.slot_bus], sram_bus_rx)
+
+        # Optional RX Descriptor (Returned on reads of the first word of the RX Slots).
+        # -----------------------------------------------------------------------------
+        # Data returned on ack corresponds to the current address (held until ack, or incremented
+        # with ack in bursts), so Descriptor selection is directly decoded from it.
+        if with_rx_descriptor:
+            writer      = self.sram.writer
+            adrbits     = log2_int(writer.slot_words)
+            sram_bus_rx = wishbone.Interface(data_width=dw, bursting=with_burst)
+            self.comb += [
+                bus_rx.connect(sram_bus_rx),
+                writer.desc_slot.eq(bus_rx.adr[adrbits:]),
+                If(bus_rx.adr[:adrbits] == 0,
+                    bus_rx.dat_r.eq(writer.desc)
+                )
+            ]
+
         # Ethernet Wishbone SRAM interfaces exposure.
         # -------------------------------------------
-        self._expose_wishbone_sram_interfaces(
-            bus        = self.bus_rx,
-            dw         = dw,
-            mems       = self.sram.writer.mems,
-            nslots     = nrxslots,
-            read_only  = rxslots_read_only,
-            write_only = False,
+        # With with_burst, incrementing bursts (CTI) are supported and acked every cycle, allowing
+        # CPUs/DMAs issuing bursts to copy the Slots at one word per cycle.
+        self.sram_rx = wishbone.SRAM(
+            mem_or_size = self.sram.writer.mems[0],
+            read_only   = rxslots_read_only,
+            write_only  = False,
+            bus         = sram_bus_rx,
         )
-        self._expose_wishbone_sram_interfaces(
-            bus        = self.bus_tx,
-            dw         = dw,
-            mems       = self.sram.reader.mems,
-            nslots     = ntxslots,
-            read_only  = False,
-            write_only = txslots_write_only,
+        self.sram_tx = wishbone.SRAM(
+            mem_or_size = self.sram.reader.mems[0],
+            read_only   = False,
+            write_only  = txslots_write_only,
+            bus         = bus_tx,
         )
 
-    def _expose_wishbone_sram_interfaces(self, bus, dw, mems, nslots, read_only, write_only):
-        # SRAMs.
-        wb_sram_ifs = []
-        for n in range(nslots):
-            wb_sram_ifs.append(wishbone.SRAM(
-                mem_or_size = mems[n],
-                read_only   = read_only,
-                write_only  = write_only,
-                bus         = wishbone.Interface(data_width=dw)
-            ))
-
-        # Expose SRAMs on Bus.
-        wb_slaves      = []
-        sram_depth     = math.ceil(eth_mtu/(dw//8))
-        decoderoffset  = log2_int(sram_depth, need_pow2=False)
-        decoderbits    = max(log2_int(len(wb_sram_ifs)), 1)
-        for n, wb_sram_if in enumerate(wb_sram_ifs):
-            def slave_filter(a, v=n):
-                return a[decoderoffset:decoderoffset + decoderbits] == v
-            wb_slaves.append((slave_filter, wb_sram_if.bus))
-            self.submodules += wb_sram_if
-        wb_con = wishbone.Decoder(bus, wb_slaves, register=True)
-        self.submodules += wb_con
+        # Optional Shared Bus (RX Slots then TX Slots on a single bus, selected by address MSB).
+        # --------------------------------------------------------------------------------------
+        if with_shared_bus:
+            sel_bit = bits_for(max(self.sram.writer.mems[0].depth, self.sram.reader.mems[0].depth) - 1)
+            self.decoder = wishbone.Decoder(self.bus, [
+                (lambda a: a[sel_bit] == 0, bus_rx),
+                (lambda a: a[sel_bit] == 1, bus_tx),
+            ])
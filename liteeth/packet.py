@@ -15,6 +15,21 @@ from litex.gen import *
 from litex.soc.interconnect.packet import Header, HeaderField
 from litex.soc.interconnect import stream
 
+# Helpers ------------------------------------------------------------------------------------------
+
+def rotate_last_be(last_be, n):
+    # Rotate last_be by a constant number of bytes (towards MSBs): Only wiring.
+    n = n%len(last_be)
+    return Cat(last_be[len(last_be) - n:], last_be[:len(last_be) - n])
+
+def rotate_last_be_wraps(last_be, n):
+    # Whether the (one-hot) last_be wraps around when rotated by n bytes, ie last byte index >=
+    # len(last_be) - n: Only an OR of the upper bits, no comparator.
+    n = n%len(last_be)
+    if n == 0:
+        return 0
+    return last_be[len(last_be) - n:] != 0
+
 # Packetizer ---------------------------------------------------------------------------------------
 
 class Packetizer(LiteXModule):
@@ -33,17 +48,15 @@ class Packetizer(LiteXModule):
         aligned         = header_leftover == 0
 
         # Signals.
-        sr       = Signal(header.length*8, reset_less=True)
-        sr_load  = Signal()
-        sr_shift = Signal()
-        count    = Signal(max=max(header_words, 2))
-        sink_d   = stream.Endpoint(sink_description)
+        count = Signal(max=max(header_words, 2))
 
-        # Header Encode/Load/Shift.
+        # Header Encode/Select.
+        # Sink is held (valid, not ready) until the first data word is accepted, so the encoded
+        # header stays stable during the header send and words can be directly selected on count.
         self.comb += header.encode(sink, self.header)
-        self.sync += If(sr_load, sr.eq(self.header))
-        if header_words != 1:
-            self.sync += If(sr_shift, sr.eq(sr[data_width:]))
+        header_slices = Array(self.header[i*data_width:(i+1)*data_width]
+            for i in range(max(header_words, 1)))
+        header_last   = self.header[header_words*data_width:]
 
         source_last_a = Signal()
         source_last_b = Signal()
@@ -53,39 +66,23 @@ class Packetizer(LiteXModule):
         self.fsm = fsm = FSM(reset_state="IDLE")
         fsm_from_idle = Signal()
         fsm.act("IDLE",
+            # Send the header words (selected on count) while sink is held.
             sink.ready.eq(1),
-            NextValue(count, 1),
             If(sink.valid,
                 sink.ready.eq(0),
                 source.valid.eq(1),
                 source_last_a.eq(0),
-                source.data.eq(self.header[:data_width]),
+                source.data.eq(header_slices[count]),
                 If(source.valid & source.ready,
-                    sr_load.eq(1),
-                    NextValue(fsm_from_idle, 1),
-                    If(header_words == 1,
+                    NextValue(count, count + 1),
+                    If(count == (header_words - 1),
+                        NextValue(count, 0),
+                        NextValue(fsm_from_idle, 1),
                         NextState("ALIGNED-DATA-COPY" if aligned else "UNALIGNED-DATA-COPY")
-                    ).Else(
-                        NextState("HEADER-SEND")
                     )
                )
             )
         )
-        fsm.act("HEADER-SEND",
-            source.valid.eq(1),
-            source_last_a.eq(0),
-            source.data.eq(sr[min(data_width, len(sr)-1):]),
-            If(source.valid & source.ready,
-                sr_shift.eq(1),
-                If(count == (header_words - 1),
-                    sr_shift.eq(0),
-                    NextState("ALIGNED-DATA-COPY" if aligned else "UNALIGNED-DATA-COPY"),
-                    NextValue(count, count + 1)
-               ).Else(
-                    NextValue(count, count + 1),
-               )
-            )
-        )
         fsm.act("ALIGNED-DATA-COPY",
             source.valid.eq(sink.valid),
             source_last_a.eq(sink.last),
@@ -98,15 +95,15 @@ class Packetizer(LiteXModule):
             )
         )
         if not aligned:
-            header_offset_multiplier = 1 if header_words == 1 else 2
+            sink_d = stream.Endpoint(sink_description)
             self.sync += If(source.valid & source.ready, sink_d.eq(sink))
             fsm.act("UNALIGNED-DATA-COPY",
                 source.valid.eq(sink.valid | sink_d.last),
                 source_last_a.eq(sink.last | sink_d.last),
                 If(fsm_from_idle,
-                    source.data[:max(header_leftover*8, 1)].eq(sr[min(header_offset_multiplier*data_width, len(sr)-1):])
+                    source.data[:header_leftover*8].eq(header_last)
                 ).Else(
-                    source.data[:max(header_leftover*8, 1)].eq(sink_d.data[min((bytes_per_clk-header_leftover)*8, data_width-1):])
+                    source.data[:header_leftover*8].eq(sink_d.data[(bytes_per_clk-header_leftover)*8:])
                 ),
                 source.data[header_leftover*8:].eq(sink.data),
                 If(source.valid & source.ready,
@@ -119,17 +116,17 @@ class Packetizer(LiteXModule):
             )
 
         # Last BE.
-        if hasattr(sink, "last_be") and hasattr(source, "last_be"):
+        has_last_be = hasattr(sink, "last_be") and hasattr(source, "last_be")
+        if has_last_be and len(sink.last_be) == 1:
             # For an 8-bit data path, last_be really should be 1 when last is
             # asserted, other values do not make sense. However, legacy code
             # might not set last_be at all, and thus it will be set to 0. To
             # remain compatible with this code, this "corrects" last_be for
-            # 8-bit paths by setting it to the value of last.
-            if len(sink.last_be) == 1:
-                sink_last_be = Signal.like(sink.last_be)
-                self.comb += [ sink_last_be.eq(sink.last) ]
-            else:
-                sink_last_be = sink.last_be
+            # 8-bit paths by setting it to the value of last (no rotation or
+            # wrap-around is possible with a single byte per word).
+            self.comb += source.last_be.eq(source.last)
+        elif has_last_be:
+            sink_last_be = sink.last_be
 
             # last_be needs to be right-rotated by the number of bytes which
             # would be required to have a properly aligned header.
@@ -137,12 +134,7 @@ class Packetizer(LiteXModule):
 
             # Calculate a rotated last_be
             new_last_be = Signal.like(sink_last_be)
-            self.comb += [
-                new_last_be.eq(Cat([
-                    sink_last_be[(i - right_rot_by) % bytes_per_clk]
-                    for i in range(bytes_per_clk)
-                ]))
-            ]
+            self.comb += new_last_be.eq(rotate_last_be(sink_last_be, right_rot_by))
 
             # Conditionally delay the calculated last_be for one clock cycle, if
             # it now applies to the next bus word OR if the source is not ready.
@@ -154,17 +146,18 @@ class Packetizer(LiteXModule):
 
             # Whether the main FSM is in one of the DATA-COPY states. This is
             # important as we overwrite sink.ready below and need to have
-            # different behavior depending on the Packetizer's state
+            # different behavior depending on the Packetizer's state (all
+            # states but IDLE are DATA-COPY states).
             in_data_copy = Signal()
             self.comb += [
-                in_data_copy.eq(self.fsm.ongoing("ALIGNED-DATA-COPY") | self.fsm.ongoing("UNALIGNED-DATA-COPY"))
+                in_data_copy.eq(~self.fsm.ongoing("IDLE"))
             ]
 
             self.last_be_fsm.act("DEFAULT",
                 # Test whether our right-shift causes a wrap-around. In that
                 # case apply the last value to the current bus word. Otherwise
                 # delay it to the next.
-                If(in_data_copy & sink.last & (sink_last_be > new_last_be),
+                If(in_data_copy & sink.last & rotate_last_be_wraps(sink_last_be, right_rot_by),
                     # Right shift did not wrap around, need to delay the
                     # calculated last_be value and last by one cycle.
                     source_last_b.eq(0),
@@ -230,19 +223,20 @@ class Depacketizer(LiteXModule):
 
         # Signals.
         sr                = Signal(header.length*8, reset_less=True)
-        sr_shift          = Signal()
-        sr_shift_leftover = Signal()
+        sr_write          = Signal()
+        sr_write_leftover = Signal()
+        sr_adr            = Signal(max=max(header_words, 2))
         count             = Signal(max=max(header_words, 2))
-        sink_d            = stream.Endpoint(sink_description)
 
-        # Header Shift/Decode.
-        if (header_words) == 1 and (header_leftover == 0):
-            self.sync += If(sr_shift, sr.eq(sink.data))
+        # Header Write/Decode: Header words are written in place (at sr_adr) and the leftover bytes
+        # at the end, only the written word toggles.
+        if header_words <= 1:
+            self.sync += If(sr_write, sr[:data_width].eq(sink.data))
         else:
-            self.sync += [
-                If(sr_shift,          sr.eq(Cat(sr[bytes_per_clk*8:],   sink.data))),
-                If(sr_shift_leftover, sr.eq(Cat(sr[header_leftover*8:], sink.data)))
-            ]
+            sr_words = Array(sr[i*data_width:(i+1)*data_width] for i in range(header_words))
+            self.sync += If(sr_write, sr_words[sr_adr].eq(sink.data))
+        if not aligned:
+            self.sync += If(sr_write_leftover, sr[header_words*data_width:].eq(sink.data))
         self.comb += self.header.eq(sr)
         self.comb += header.decode(self.header, source)
 
@@ -257,7 +251,7 @@ class Depacketizer(LiteXModule):
             sink.ready.eq(1),
             NextValue(count, 1),
             If(sink.valid,
-                sr_shift.eq(1),
+                sr_write.eq(1),
                 NextValue(fsm_from_idle, 1),
                 If(header_words == 1,
                     NextState("ALIGNED-DATA-COPY" if aligned else "UNALIGNED-DATA-COPY"),
@@ -268,9 +262,10 @@ class Depacketizer(LiteXModule):
         )
         fsm.act("HEADER-RECEIVE",
             sink.ready.eq(1),
+            sr_adr.eq(count),
             If(sink.valid,
                 NextValue(count, count + 1),
-                sr_shift.eq(1),
+                sr_write.eq(1),
                 If(count == (header_words - 1),
                     NextState("ALIGNED-DATA-COPY" if aligned else "UNALIGNED-DATA-COPY"),
                     NextValue(count, count + 1),
@@ -278,8 +273,8 @@ class Depacketizer(LiteXModule):
             )
         )
         fsm.act("ALIGNED-DATA-COPY",
-            source.valid.eq(sink.valid | sink_d.last),
-            source_last_a.eq(sink.last | sink_d.last),
+            source.valid.eq(sink.valid),
+            source_last_a.eq(sink.last),
             sink.ready.eq(source.ready),
             source.data.eq(sink.data),
             If(source.valid & source.ready,
@@ -290,19 +285,20 @@ class Depacketizer(LiteXModule):
         )
 
         if not aligned:
+            sink_d = stream.Endpoint(sink_description)
             self.sync += If(sink.valid & sink.ready, sink_d.eq(sink))
             fsm.act("UNALIGNED-DATA-COPY",
                 source.valid.eq(sink.valid | sink_d.last),
                 source_last_a.eq(sink_d.last),
                 sink.ready.eq(source.ready & ~source.last),
                 source.data.eq(sink_d.data[header_leftover*8:]),
-                source.data[min((bytes_per_clk-header_leftover)*8, data_width-1):].eq(sink.data),
+                source.data[(bytes_per_clk-header_leftover)*8:].eq(sink.data),
                 If(fsm_from_idle,
                     source.valid.eq(sink_d.last),
                     sink.ready.eq(~sink_d.last),
                     If(sink.valid,
                         NextValue(fsm_from_idle, 0),
-                        sr_shift_leftover.eq(1),
+                        sr_write_leftover.eq(1),
                     )
                 ),
                 If(source.valid & source.ready,
@@ -317,17 +313,17 @@ class Depacketizer(LiteXModule):
             self.comb += source.error.eq(sink.error)
 
         # Last BE.
-        if hasattr(sink, "last_be") and hasattr(source, "last_be"):
+        has_last_be = hasattr(sink, "last_be") and hasattr(source, "last_be")
+        if has_last_be and len(sink.last_be) == 1:
             # For an 8-bit data path, last_be really should be 1 when last is
             # asserted, other values do not make sense. However, legacy code
             # might not set last_be at all, and thus it will be set to 0. To
             # remain compatible with this code, this "corrects" last_be for
-            # 8-bit paths by setting it to the value of last.
-            if len(sink.last_be) == 1:
-                sink_last_be = Signal.like(sink.last_be)
-                self.comb += [ sink_last_be.eq(sink.last) ]
-            else:
-                sink_last_be = sink.last_be
+            # 8-bit paths by setting it to the value of last (no rotation or
+            # wrap-around is possible with a single byte per word).
+            self.comb += source.last_be.eq(source.last)
+        elif has_last_be:
+            sink_last_be = sink.last_be
 
             # last_be needs to be left-rotated by the number of bytes which
             # would be required to have a properly aligned header.
@@ -335,12 +331,7 @@ class Depacketizer(LiteXModule):
 
             # Calculate a rotated last_be
             new_last_be = Signal.like(sink_last_be)
-            self.comb += [
-                new_last_be.eq(Cat([
-                    sink_last_be[(i - left_rot_by) % bytes_per_clk]
-                    for i in range(bytes_per_clk)
-                ]))
-            ]
+            self.comb += new_last_be.eq(rotate_last_be(sink_last_be, left_rot_by))
 
             # Conditionally delay the calculated last_be for one clock cycle, if
             # it now applies to the next bus word.
@@ -369,7 +360,7 @@ class Depacketizer(LiteXModule):
             self.last_be_fsm.act("DEFAULT",
                 # Test whether our left-shift has caused an wrap-around, in that
                 # case delay last and last_be and apply to the next bus word.
-                If(sink.valid & sink.last & (sink_last_be > new_last_be),
+                If(sink.valid & sink.last & rotate_last_be_wraps(sink_last_be, left_rot_by),
                     # last_be did wrap around. Need to delay the calculated
                     # last_be value and last by one cycle.
                     source_last_b.eq(0),
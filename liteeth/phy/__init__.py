@@ -1,3 +1,5 @@
+import importlib
+
 from liteeth.common import *
 
 
@@ -22,24 +24,40 @@ def LiteEthPHY(clock_pads, pads, clk_freq=None, **kwargs):
     else:
         raise ValueError("Unable to autodetect PHY from platform file, use direct instantiation")
 
-from liteeth.phy.mii      import LiteEthPHYMII
-from liteeth.phy.rmii     import LiteEthPHYRMII
-from liteeth.phy.gmii     import LiteEthPHYGMII
-from liteeth.phy.gmii_mii import LiteEthPHYGMIIMII
-from liteeth.phy.xgmii    import LiteEthPHYXGMII
-
-from liteeth.phy.s6rgmii   import LiteEthPHYRGMII as LiteEthS6PHYRGMII
-from liteeth.phy.s7rgmii   import LiteEthPHYRGMII as LiteEthS7PHYRGMII
-from liteeth.phy.usrgmii   import LiteEthPHYRGMII as LiteEthUSPHYRGMII
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII as LiteEthECP5PHYRGMII
-
-from liteeth.phy.a7_1000basex      import A7_1000BASEX
-from liteeth.phy.a7_1000basex      import A7_2500BASEX
-from liteeth.phy.k7_1000basex      import K7_1000BASEX
-from liteeth.phy.k7_1000basex      import K7_2500BASEX
-from liteeth.phy.ku_1000basex      import KU_1000BASEX
-from liteeth.phy.ku_1000basex      import KU_2500BASEX
-from liteeth.phy.usp_gth_1000basex import USP_GTH_1000BASEX
-from liteeth.phy.usp_gth_1000basex import USP_GTH_2500BASEX
-from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
-from liteeth.phy.usp_gty_1000basex import USP_GTY_2500BASEX
+# PHYs (Lazily imported on first access, to avoid importing all the PHYs/vendor backends with the
+# package).
+
+_phys = {
+    # Name                  : (Module,              Class).
+    "LiteEthPHYMII"         : ("mii",               "LiteEthPHYMII"),
+    "LiteEthPHYRMII"        : ("rmii",              "LiteEthPHYRMII"),
+    "LiteEthPHYGMII"        : ("gmii",              "LiteEthPHYGMII"),
+    "LiteEthPHYGMIIMII"     : ("gmii_mii",          "LiteEthPHYGMIIMII"),
+    "LiteEthPHYXGMII"       : ("xgmii",             "LiteEthPHYXGMII"),
+
+    "LiteEthS6PHYRGMII"     : ("s6rgmii",           "LiteEthPHYRGMII"),
+    "LiteEthS7PHYRGMII"     : ("s7rgmii",           "LiteEthPHYRGMII"),
+    "LiteEthUSPHYRGMII"     : ("usrgmii",           "LiteEthPHYRGMII"),
+    "LiteEthECP5PHYRGMII"   : ("ecp5rgmii",         "LiteEthPHYRGMII"),
+
+    "A7_1000BASEX"          : ("a7_1000basex",      "A7_1000BASEX"),
+    "A7_2500BASEX"          : ("a7_1000basex",      "A7_2500BASEX"),
+    "K7_1000BASEX"          : ("k7_1000basex",      "K7_1000BASEX"),
+    "K7_2500BASEX"          : ("k7_1000basex",      "K7_2500BASEX"),
+    "KU_1000BASEX"          : ("ku_1000basex",      "KU_1000BASEX"),
+    "KU_2500BASEX"          : ("ku_1000basex",      "KU_2500BASEX"),
+    "USP_GTH_1000BASEX"     : ("usp_gth_1000basex", "USP_GTH_1000BASEX"),
+    "USP_GTH_2500BASEX"     : ("usp_gth_1000basex", "USP_GTH_2500BASEX"),
+    "USP_GTY_1000BASEX"     : ("usp_gty_1000basex", "USP_GTY_1000BASEX"),
+    "USP_GTY_2500BASEX"     : ("usp_gty_1000basex", "USP_GTY_2500BASEX"),
+}
+
+def __getattr__(name):
+    if name in _phys:
+        module, cls = _phys[name]
+        value = getattr(importlib.import_module(f"{__name__}.{module}"), cls)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = [name for name in globals() if not name.startswith("_")] + list(_phys)
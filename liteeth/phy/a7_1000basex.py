@@ -18,6 +18,329 @@ from liteeth.common import *
 from liteeth.phy.a7_gtp import *
 from liteeth.phy.pcs_1000basex import *
 
+# A7_1000BASEX GTP Parameters ----------------------------------------------------------------------
+
+# Static GTPE2_CHANNEL attributes, shared by all instances (built once at import).
+# Work around Python's 255 argument limitation.
+_gtp_static_params = dict(
+    # Simulation-Only Attributes
+    p_SIM_RECEIVER_DETECT_PASS   = "TRUE",
+    p_SIM_TX_EIDLE_DRIVE_LEVEL   = "X",
+    p_SIM_RESET_SPEEDUP          = "FALSE",
+    p_SIM_VERSION                = "2.0",
+
+    # RX Byte and Word Alignment Attributes
+    p_ALIGN_COMMA_DOUBLE         = "FALSE",
+    p_ALIGN_COMMA_ENABLE         = 0b1111111111,
+    p_ALIGN_COMMA_WORD           = 2,
+    p_ALIGN_MCOMMA_DET           = "TRUE",
+    p_ALIGN_MCOMMA_VALUE         = 0b1010000011,
+    p_ALIGN_PCOMMA_DET           = "TRUE",
+    p_ALIGN_PCOMMA_VALUE         = 0b0101111100,
+    p_SHOW_REALIGN_COMMA         = "TRUE",
+    p_RXSLIDE_AUTO_WAIT          = 7,
+    p_RXSLIDE_MODE               = "OFF",
+    p_RX_SIG_VALID_DLY           = 10,
+
+    # RX 8B/10B Decoder Attributes
+    p_RX_DISPERR_SEQ_MATCH       = "FALSE",
+    p_DEC_MCOMMA_DETECT          = "FALSE",
+    p_DEC_PCOMMA_DETECT          = "FALSE",
+    p_DEC_VALID_COMMA_ONLY       = "FALSE",
+
+    # RX Clock Correction Attributes
+    p_CBCC_DATA_SOURCE_SEL       = "ENCODED",
+    p_CLK_COR_SEQ_2_USE          = "FALSE",
+    p_CLK_COR_KEEP_IDLE          = "FALSE",
+    p_CLK_COR_MAX_LAT            = 9,
+    p_CLK_COR_MIN_LAT            = 7,
+    p_CLK_COR_PRECEDENCE         = "TRUE",
+    p_CLK_COR_REPEAT_WAIT        = 0,
+    p_CLK_COR_SEQ_LEN            = 1,
+    p_CLK_COR_SEQ_1_ENABLE       = 0b1111,
+    p_CLK_COR_SEQ_1_1            = 0b0100000000,
+    p_CLK_COR_SEQ_1_2            = 0b0000000000,
+    p_CLK_COR_SEQ_1_3            = 0b0000000000,
+    p_CLK_COR_SEQ_1_4            = 0b0000000000,
+    p_CLK_CORRECT_USE            = "FALSE",
+    p_CLK_COR_SEQ_2_ENABLE       = 0b1111,
+    p_CLK_COR_SEQ_2_1            = 0b0100000000,
+    p_CLK_COR_SEQ_2_2            = 0b0000000000,
+    p_CLK_COR_SEQ_2_3            = 0b0000000000,
+    p_CLK_COR_SEQ_2_4            = 0b0000000000,
+
+    # RX Channel Bonding Attributes
+    p_CHAN_BOND_KEEP_ALIGN       = "FALSE",
+    p_CHAN_BOND_MAX_SKEW         = 1,
+    p_CHAN_BOND_SEQ_LEN          = 1,
+    p_CHAN_BOND_SEQ_1_1          = 0b0000000000,
+    p_CHAN_BOND_SEQ_1_2          = 0b0000000000,
+    p_CHAN_BOND_SEQ_1_3          = 0b0000000000,
+    p_CHAN_BOND_SEQ_1_4          = 0b0000000000,
+    p_CHAN_BOND_SEQ_1_ENABLE     = 0b1111,
+    p_CHAN_BOND_SEQ_2_1          = 0b0000000000,
+    p_CHAN_BOND_SEQ_2_2          = 0b0000000000,
+    p_CHAN_BOND_SEQ_2_3          = 0b0000000000,
+    p_CHAN_BOND_SEQ_2_4          = 0b0000000000,
+    p_CHAN_BOND_SEQ_2_ENABLE     = 0b1111,
+    p_CHAN_BOND_SEQ_2_USE        = "FALSE",
+    p_FTS_DESKEW_SEQ_ENABLE      = 0b1111,
+    p_FTS_LANE_DESKEW_CFG        = 0b1111,
+    p_FTS_LANE_DESKEW_EN         = "FALSE",
+
+    # RX Margin Analysis Attributes
+    p_ES_CONTROL                 = 0b000000,
+    p_ES_ERRDET_EN               = "FALSE",
+    p_ES_EYE_SCAN_EN             = "FALSE",
+    p_ES_HORZ_OFFSET             = 0x010,
+    p_ES_PMA_CFG                 = 0b0000000000,
+    p_ES_PRESCALE                = 0b00000,
+    p_ES_QUALIFIER               = 0x00000000000000000000,
+    p_ES_QUAL_MASK               = 0x00000000000000000000,
+    p_ES_SDATA_MASK              = 0x00000000000000000000,
+    p_ES_VERT_OFFSET             = 0b000000000,
+
+    # FPGA RX Interface Attributes
+    p_RX_DATA_WIDTH              = 20,
+
+    # PMA Attributes
+    p_OUTREFCLK_SEL_INV          = 0b11,
+    p_PMA_RSV                    = 0x00000333,
+    p_PMA_RSV2                   = 0x00002040,
+    p_PMA_RSV3                   = 0b00,
+    p_PMA_RSV4                   = 0b0000,
+    p_RX_BIAS_CFG                = 0b0000111100110011,
+    p_DMONITOR_CFG               = 0x000A00,
+    p_RX_CM_SEL                  = 0b01,
+    p_RX_CM_TRIM                 = 0b0000,
+    p_RX_DEBUG_CFG               = 0b00000000000000,
+    p_RX_OS_CFG                  = 0b0000010000000,
+    p_TERM_RCAL_CFG              = 0b100001000010000,
+    p_TERM_RCAL_OVRD             = 0b000,
+    p_TST_RSV                    = 0x00000000,
+    p_RX_CLK25_DIV               = 5,
+    p_TX_CLK25_DIV               = 5,
+    p_UCODEER_CLR                = 0b0,
+
+    # PCI Express Attributes
+    p_PCS_PCIE_EN                = "FALSE",
+
+    # PCS Attributes
+    p_PCS_RSVD_ATTR              = 0x000000000000,
+
+    # RX Buffer Attributes
+    p_RXBUF_ADDR_MODE            = "FAST",
+    p_RXBUF_EIDLE_HI_CNT         = 0b1000,
+    p_RXBUF_EIDLE_LO_CNT         = 0b0000,
+    p_RXBUF_EN                   = "TRUE",
+    p_RX_BUFFER_CFG              = 0b000000,
+    p_RXBUF_RESET_ON_CB_CHANGE   = "TRUE",
+    p_RXBUF_RESET_ON_COMMAALIGN  = "FALSE",
+    p_RXBUF_RESET_ON_EIDLE       = "FALSE",
+    p_RXBUF_RESET_ON_RATE_CHANGE = "TRUE",
+    p_RXBUFRESET_TIME            = 0b00001,
+    p_RXBUF_THRESH_OVFLW         = 61,
+    p_RXBUF_THRESH_OVRD          = "FALSE",
+    p_RXBUF_THRESH_UNDFLW        = 4,
+    p_RXDLY_CFG                  = 0x001F,
+    p_RXDLY_LCFG                 = 0x030,
+    p_RXDLY_TAP_CFG              = 0x0000,
+    p_RXPH_CFG                   = 0xC00002,
+    p_RXPHDLY_CFG                = 0x084020,
+    p_RXPH_MONITOR_SEL           = 0b00000,
+    p_RX_XCLK_SEL                = "RXREC",
+    p_RX_DDI_SEL                 = 0b000000,
+    p_RX_DEFER_RESET_BUF_EN      = "TRUE",
+
+    # CDR Attributes
+    p_RXCDR_FR_RESET_ON_EIDLE    = 0b0,
+    p_RXCDR_HOLD_DURING_EIDLE    = 0b0,
+    p_RXCDR_PH_RESET_ON_EIDLE    = 0b0,
+    p_RXCDR_LOCK_CFG             = 0b001001,
+
+    # RX Initialization and Reset Attributes
+    p_RXCDRFREQRESET_TIME        = 0b00001,
+    p_RXCDRPHRESET_TIME          = 0b00001,
+    p_RXISCANRESET_TIME          = 0b00001,
+    p_RXPCSRESET_TIME            = 0b00001,
+    p_RXPMARESET_TIME            = 0b00011,
+
+    # RX OOB Signaling Attributes
+    p_RXOOB_CFG                  = 0b0000110,
+
+    # RX Gearbox Attributes
+    p_RXGEARBOX_EN               = "FALSE",
+    p_GEARBOX_MODE               = 0b000,
+
+    # PRBS Detection Attribute
+    p_RXPRBS_ERR_LOOPBACK        = 0b0,
+
+    # Power-Down Attributes
+    p_PD_TRANS_TIME_FROM_P2      = 0x03c,
+    p_PD_TRANS_TIME_NONE_P2      = 0x3c,
+    p_PD_TRANS_TIME_TO_P2        = 0x64,
+
+    # RX OOB Signaling Attributes
+    p_SAS_MAX_COM                = 64,
+    p_SAS_MIN_COM                = 36,
+    p_SATA_BURST_SEQ_LEN         = 0b0101,
+    p_SATA_BURST_VAL             = 0b100,
+    p_SATA_EIDLE_VAL             = 0b100,
+    p_SATA_MAX_BURST             = 8,
+    p_SATA_MAX_INIT              = 21,
+    p_SATA_MAX_WAKE              = 7,
+    p_SATA_MIN_BURST             = 4,
+    p_SATA_MIN_INIT              = 12,
+    p_SATA_MIN_WAKE              = 4,
+
+    # RX Fabric Clock Output Control Attributes
+    p_TRANS_TIME_RATE            = 0x0E,
+
+    # TX Buffer Attributes
+    p_TXBUF_EN                   = "TRUE",
+    p_TXBUF_RESET_ON_RATE_CHANGE = "TRUE",
+    p_TXDLY_CFG                  = 0x001F,
+    p_TXDLY_LCFG                 = 0x030,
+    p_TXDLY_TAP_CFG              = 0x0000,
+    p_TXPH_CFG                   = 0x0780,
+    p_TXPHDLY_CFG                = 0x084020,
+    p_TXPH_MONITOR_SEL           = 0b00000,
+    p_TX_XCLK_SEL                = "TXOUT",
+
+    # FPGA TX Interface Attributes
+    p_TX_DATA_WIDTH              = 20,
+
+    # TX Configurable Driver Attributes
+    p_TX_DEEMPH0                 = 0b000000,
+    p_TX_DEEMPH1                 = 0b000000,
+    p_TX_EIDLE_ASSERT_DELAY      = 0b110,
+    p_TX_EIDLE_DEASSERT_DELAY    = 0b100,
+    p_TX_LOOPBACK_DRIVE_HIZ      = "FALSE",
+    p_TX_MAINCURSOR_SEL          = 0b0,
+    p_TX_DRIVE_MODE              = "DIRECT",
+    p_TX_MARGIN_FULL_0           = 0b1001110,
+    p_TX_MARGIN_FULL_1           = 0b1001001,
+    p_TX_MARGIN_FULL_2           = 0b1000101,
+    p_TX_MARGIN_FULL_3           = 0b1000010,
+    p_TX_MARGIN_FULL_4           = 0b1000000,
+    p_TX_MARGIN_LOW_0            = 0b1000110,
+    p_TX_MARGIN_LOW_1            = 0b1000100,
+    p_TX_MARGIN_LOW_2            = 0b1000010,
+    p_TX_MARGIN_LOW_3            = 0b1000000,
+    p_TX_MARGIN_LOW_4            = 0b1000000,
+
+    # TX Gearbox Attributes
+    p_TXGEARBOX_EN               = "FALSE",
+
+    # TX Initialization and Reset Attributes
+    p_TXPCSRESET_TIME            = 0b00001,
+    p_TXPMARESET_TIME            = 0b00001,
+
+    # TX Receiver Detection Attributes
+    p_TX_RXDETECT_CFG            = 0x1832,
+    p_TX_RXDETECT_REF            = 0b100,
+
+    # JTAG Attributes
+    p_ACJTAG_DEBUG_MODE          = 0b0,
+    p_ACJTAG_MODE                = 0b0,
+    p_ACJTAG_RESET               = 0b0,
+
+    # CDR Attributes
+    p_CFOK_CFG                   = 0x49000040E80,
+    p_CFOK_CFG2                  = 0b0100000,
+    p_CFOK_CFG3                  = 0b0100000,
+    p_CFOK_CFG4                  = 0b0,
+    p_CFOK_CFG5                  = 0x0,
+    p_CFOK_CFG6                  = 0b0000,
+    p_RXOSCALRESET_TIME          = 0b00011,
+    p_RXOSCALRESET_TIMEOUT       = 0b00000,
+
+    # PMA Attributes
+    p_CLK_COMMON_SWING           = 0b0,
+    p_RX_CLKMUX_EN               = 0b1,
+    p_TX_CLKMUX_EN               = 0b1,
+    p_ES_CLK_PHASE_SEL           = 0b0,
+    p_USE_PCS_CLK_PHASE_SEL      = 0b0,
+    p_PMA_RSV6                   = 0b0,
+    p_PMA_RSV7                   = 0b0,
+
+    # TX Configuration Driver Attributes
+    p_TX_PREDRIVER_MODE          = 0b0,
+    p_PMA_RSV5                   = 0b0,
+    p_SATA_PLL_CFG               = "VCO_3000MHZ",
+
+    # RX Phase Interpolator Attributes
+    p_RXPI_CFG0                  = 0b000,
+    p_RXPI_CFG1                  = 0b1,
+    p_RXPI_CFG2                  = 0b1,
+
+    # RX Equalizer Attributes
+    p_ADAPT_CFG0                 = 0x00000,
+    p_RXLPMRESET_TIME            = 0b0001111,
+    p_RXLPM_BIAS_STARTUP_DISABLE = 0b0,
+    p_RXLPM_CFG                  = 0b0110,
+    p_RXLPM_CFG1                 = 0b0,
+    p_RXLPM_CM_CFG               = 0b0,
+    p_RXLPM_GC_CFG               = 0b111100010,
+    p_RXLPM_GC_CFG2              = 0b001,
+    p_RXLPM_HF_CFG               = 0b00001111110000,
+    p_RXLPM_HF_CFG2              = 0b01010,
+    p_RXLPM_HF_CFG3              = 0b0000,
+    p_RXLPM_HOLD_DURING_EIDLE    = 0b0,
+    p_RXLPM_INCM_CFG             = 0b0,
+    p_RXLPM_IPCM_CFG             = 0b1,
+    p_RXLPM_LF_CFG               = 0b000000001111110000,
+    p_RXLPM_LF_CFG2              = 0b01010,
+    p_RXLPM_OSINT_CFG            = 0b100,
+
+    # TX Phase Interpolator PPM Controller Attributes
+    p_TXPI_CFG0                  = 0b00,
+    p_TXPI_CFG1                  = 0b00,
+    p_TXPI_CFG2                  = 0b00,
+    p_TXPI_CFG3                  = 0b0,
+    p_TXPI_CFG4                  = 0b0,
+    p_TXPI_CFG5                  = 0b000,
+    p_TXPI_GREY_SEL              = 0b0,
+    p_TXPI_INVSTROBE_SEL         = 0b0,
+    p_TXPI_PPMCLK_SEL            = "TXUSRCLK2",
+    p_TXPI_PPM_CFG               = 0x00,
+    p_TXPI_SYNFREQ_PPM           = 0b001,
+
+    # LOOPBACK Attributes
+    p_LOOPBACK_CFG               = 0b0,
+    p_PMA_LOOPBACK_CFG           = 0b0,
+
+    # RX OOB Signalling Attributes
+    p_RXOOB_CLK_CFG              = "PMA",
+
+    # TX OOB Signalling Attributes
+    p_TXOOB_CFG                  = 0b0,
+
+    # RX Buffer Attributes
+    p_RXSYNC_MULTILANE           = 0b0,
+    p_RXSYNC_OVRD                = 0b0,
+    p_RXSYNC_SKIP_DA             = 0b0,
+
+    # TX Buffer Attributes
+    p_TXSYNC_MULTILANE           = 0b0,
+    p_TXSYNC_OVRD                = 0b0,
+    p_TXSYNC_SKIP_DA             = 0b0
+)
+
+# Linerate dependent GTPE2_CHANNEL attributes.
+_gtp_linerate_params = {
+    1.25e9 : dict(
+        p_RXCDR_CFG = 0x0000107FE106001041010,
+        p_RXOUT_DIV = 4,
+        p_TXOUT_DIV = 4,
+    ),
+    3.125e9 : dict(
+        p_RXCDR_CFG = 0x0000107FE206001041010,
+        p_RXOUT_DIV = 2,
+        p_TXOUT_DIV = 2,
+    ),
+}
+
 # A7_1000BASEX PHY ---------------------------------------------------------------------------------
 
 class A7_1000BASEX(LiteXModule):
@@ -29,13 +352,17 @@ class A7_1000BASEX(LiteXModule):
         # TX Parameters.
         tx_cm_type     = "PLL",
         tx_cm_buf_type = "BUFH",
+        tx_rebuf_type  = "BUFG",
         tx_polarity    = 0,
 
         # RX Parameters.
         rx_cm_type     = "PLL",
         rx_cm_buf_type = "BUFG",
+        rx_rebuf_type  = "BUFG",
         rx_polarity    = 0,
     ):
+        assert tx_rebuf_type in ["BUFG", "BUFH", "BUFR"]
+        assert rx_rebuf_type in ["BUFG", "BUFH", "BUFR"]
         self.pcs = pcs = PCS(lsb_first=True)
 
         self.sink    = pcs.sink
@@ -78,323 +405,7 @@ class A7_1000BASEX(LiteXModule):
         drpdo   = Signal(16)
         drpwe   = Signal()
 
-
-        # Work around Python's 255 argument limitation.
-        gtp_params = dict(
-            # Simulation-Only Attributes
-            p_SIM_RECEIVER_DETECT_PASS   = "TRUE",
-            p_SIM_TX_EIDLE_DRIVE_LEVEL   = "X",
-            p_SIM_RESET_SPEEDUP          = "FALSE",
-            p_SIM_VERSION                = "2.0",
-
-            # RX Byte and Word Alignment Attributes
-            p_ALIGN_COMMA_DOUBLE         = "FALSE",
-            p_ALIGN_COMMA_ENABLE         = 0b1111111111,
-            p_ALIGN_COMMA_WORD           = 2,
-            p_ALIGN_MCOMMA_DET           = "TRUE",
-            p_ALIGN_MCOMMA_VALUE         = 0b1010000011,
-            p_ALIGN_PCOMMA_DET           = "TRUE",
-            p_ALIGN_PCOMMA_VALUE         = 0b0101111100,
-            p_SHOW_REALIGN_COMMA         = "TRUE",
-            p_RXSLIDE_AUTO_WAIT          = 7,
-            p_RXSLIDE_MODE               = "OFF",
-            p_RX_SIG_VALID_DLY           = 10,
-
-            # RX 8B/10B Decoder Attributes
-            p_RX_DISPERR_SEQ_MATCH       = "FALSE",
-            p_DEC_MCOMMA_DETECT          = "FALSE",
-            p_DEC_PCOMMA_DETECT          = "FALSE",
-            p_DEC_VALID_COMMA_ONLY       = "FALSE",
-
-            # RX Clock Correction Attributes
-            p_CBCC_DATA_SOURCE_SEL       = "ENCODED",
-            p_CLK_COR_SEQ_2_USE          = "FALSE",
-            p_CLK_COR_KEEP_IDLE          = "FALSE",
-            p_CLK_COR_MAX_LAT            = 9,
-            p_CLK_COR_MIN_LAT            = 7,
-            p_CLK_COR_PRECEDENCE         = "TRUE",
-            p_CLK_COR_REPEAT_WAIT        = 0,
-            p_CLK_COR_SEQ_LEN            = 1,
-            p_CLK_COR_SEQ_1_ENABLE       = 0b1111,
-            p_CLK_COR_SEQ_1_1            = 0b0100000000,
-            p_CLK_COR_SEQ_1_2            = 0b0000000000,
-            p_CLK_COR_SEQ_1_3            = 0b0000000000,
-            p_CLK_COR_SEQ_1_4            = 0b0000000000,
-            p_CLK_CORRECT_USE            = "FALSE",
-            p_CLK_COR_SEQ_2_ENABLE       = 0b1111,
-            p_CLK_COR_SEQ_2_1            = 0b0100000000,
-            p_CLK_COR_SEQ_2_2            = 0b0000000000,
-            p_CLK_COR_SEQ_2_3            = 0b0000000000,
-            p_CLK_COR_SEQ_2_4            = 0b0000000000,
-
-            # RX Channel Bonding Attributes
-            p_CHAN_BOND_KEEP_ALIGN       = "FALSE",
-            p_CHAN_BOND_MAX_SKEW         = 1,
-            p_CHAN_BOND_SEQ_LEN          = 1,
-            p_CHAN_BOND_SEQ_1_1          = 0b0000000000,
-            p_CHAN_BOND_SEQ_1_2          = 0b0000000000,
-            p_CHAN_BOND_SEQ_1_3          = 0b0000000000,
-            p_CHAN_BOND_SEQ_1_4          = 0b0000000000,
-            p_CHAN_BOND_SEQ_1_ENABLE     = 0b1111,
-            p_CHAN_BOND_SEQ_2_1          = 0b0000000000,
-            p_CHAN_BOND_SEQ_2_2          = 0b0000000000,
-            p_CHAN_BOND_SEQ_2_3          = 0b0000000000,
-            p_CHAN_BOND_SEQ_2_4          = 0b0000000000,
-            p_CHAN_BOND_SEQ_2_ENABLE     = 0b1111,
-            p_CHAN_BOND_SEQ_2_USE        = "FALSE",
-            p_FTS_DESKEW_SEQ_ENABLE      = 0b1111,
-            p_FTS_LANE_DESKEW_CFG        = 0b1111,
-            p_FTS_LANE_DESKEW_EN         = "FALSE",
-
-            # RX Margin Analysis Attributes
-            p_ES_CONTROL                 = 0b000000,
-            p_ES_ERRDET_EN               = "FALSE",
-            p_ES_EYE_SCAN_EN             = "FALSE",
-            p_ES_HORZ_OFFSET             = 0x010,
-            p_ES_PMA_CFG                 = 0b0000000000,
-            p_ES_PRESCALE                = 0b00000,
-            p_ES_QUALIFIER               = 0x00000000000000000000,
-            p_ES_QUAL_MASK               = 0x00000000000000000000,
-            p_ES_SDATA_MASK              = 0x00000000000000000000,
-            p_ES_VERT_OFFSET             = 0b000000000,
-
-            # FPGA RX Interface Attributes
-            p_RX_DATA_WIDTH              = 20,
-
-            # PMA Attributes
-            p_OUTREFCLK_SEL_INV          = 0b11,
-            p_PMA_RSV                    = 0x00000333,
-            p_PMA_RSV2                   = 0x00002040,
-            p_PMA_RSV3                   = 0b00,
-            p_PMA_RSV4                   = 0b0000,
-            p_RX_BIAS_CFG                = 0b0000111100110011,
-            p_DMONITOR_CFG               = 0x000A00,
-            p_RX_CM_SEL                  = 0b01,
-            p_RX_CM_TRIM                 = 0b0000,
-            p_RX_DEBUG_CFG               = 0b00000000000000,
-            p_RX_OS_CFG                  = 0b0000010000000,
-            p_TERM_RCAL_CFG              = 0b100001000010000,
-            p_TERM_RCAL_OVRD             = 0b000,
-            p_TST_RSV                    = 0x00000000,
-            p_RX_CLK25_DIV               = 5,
-            p_TX_CLK25_DIV               = 5,
-            p_UCODEER_CLR                = 0b0,
-
-            # PCI Express Attributes
-            p_PCS_PCIE_EN                = "FALSE",
-
-            # PCS Attributes
-            p_PCS_RSVD_ATTR              = 0x000000000000,
-
-            # RX Buffer Attributes
-            p_RXBUF_ADDR_MODE            = "FAST",
-            p_RXBUF_EIDLE_HI_CNT         = 0b1000,
-            p_RXBUF_EIDLE_LO_CNT         = 0b0000,
-            p_RXBUF_EN                   = "TRUE",
-            p_RX_BUFFER_CFG              = 0b000000,
-            p_RXBUF_RESET_ON_CB_CHANGE   = "TRUE",
-            p_RXBUF_RESET_ON_COMMAALIGN  = "FALSE",
-            p_RXBUF_RESET_ON_EIDLE       = "FALSE",
-            p_RXBUF_RESET_ON_RATE_CHANGE = "TRUE",
-            p_RXBUFRESET_TIME            = 0b00001,
-            p_RXBUF_THRESH_OVFLW         = 61,
-            p_RXBUF_THRESH_OVRD          = "FALSE",
-            p_RXBUF_THRESH_UNDFLW        = 4,
-            p_RXDLY_CFG                  = 0x001F,
-            p_RXDLY_LCFG                 = 0x030,
-            p_RXDLY_TAP_CFG              = 0x0000,
-            p_RXPH_CFG                   = 0xC00002,
-            p_RXPHDLY_CFG                = 0x084020,
-            p_RXPH_MONITOR_SEL           = 0b00000,
-            p_RX_XCLK_SEL                = "RXREC",
-            p_RX_DDI_SEL                 = 0b000000,
-            p_RX_DEFER_RESET_BUF_EN      = "TRUE",
-
-            # CDR Attributes
-            p_RXCDR_CFG                  = {
-                1.25e9  : 0x0000107FE106001041010,
-                3.125e9 : 0x0000107FE206001041010,
-            }[self.linerate],
-            p_RXCDR_FR_RESET_ON_EIDLE    = 0b0,
-            p_RXCDR_HOLD_DURING_EIDLE    = 0b0,
-            p_RXCDR_PH_RESET_ON_EIDLE    = 0b0,
-            p_RXCDR_LOCK_CFG             = 0b001001,
-
-            # RX Initialization and Reset Attributes
-            p_RXCDRFREQRESET_TIME        = 0b00001,
-            p_RXCDRPHRESET_TIME          = 0b00001,
-            p_RXISCANRESET_TIME          = 0b00001,
-            p_RXPCSRESET_TIME            = 0b00001,
-            p_RXPMARESET_TIME            = 0b00011,
-
-            # RX OOB Signaling Attributes
-            p_RXOOB_CFG                  = 0b0000110,
-
-            # RX Gearbox Attributes
-            p_RXGEARBOX_EN               = "FALSE",
-            p_GEARBOX_MODE               = 0b000,
-
-            # PRBS Detection Attribute
-            p_RXPRBS_ERR_LOOPBACK        = 0b0,
-
-            # Power-Down Attributes
-            p_PD_TRANS_TIME_FROM_P2      = 0x03c,
-            p_PD_TRANS_TIME_NONE_P2      = 0x3c,
-            p_PD_TRANS_TIME_TO_P2        = 0x64,
-
-            # RX OOB Signaling Attributes
-            p_SAS_MAX_COM                = 64,
-            p_SAS_MIN_COM                = 36,
-            p_SATA_BURST_SEQ_LEN         = 0b0101,
-            p_SATA_BURST_VAL             = 0b100,
-            p_SATA_EIDLE_VAL             = 0b100,
-            p_SATA_MAX_BURST             = 8,
-            p_SATA_MAX_INIT              = 21,
-            p_SATA_MAX_WAKE              = 7,
-            p_SATA_MIN_BURST             = 4,
-            p_SATA_MIN_INIT              = 12,
-            p_SATA_MIN_WAKE              = 4,
-
-            # RX Fabric Clock Output Control Attributes
-            p_TRANS_TIME_RATE            = 0x0E,
-
-            # TX Buffer Attributes
-            p_TXBUF_EN                   = "TRUE",
-            p_TXBUF_RESET_ON_RATE_CHANGE = "TRUE",
-            p_TXDLY_CFG                  = 0x001F,
-            p_TXDLY_LCFG                 = 0x030,
-            p_TXDLY_TAP_CFG              = 0x0000,
-            p_TXPH_CFG                   = 0x0780,
-            p_TXPHDLY_CFG                = 0x084020,
-            p_TXPH_MONITOR_SEL           = 0b00000,
-            p_TX_XCLK_SEL                = "TXOUT",
-
-            # FPGA TX Interface Attributes
-            p_TX_DATA_WIDTH              = 20,
-
-            # TX Configurable Driver Attributes
-            p_TX_DEEMPH0                 = 0b000000,
-            p_TX_DEEMPH1                 = 0b000000,
-            p_TX_EIDLE_ASSERT_DELAY      = 0b110,
-            p_TX_EIDLE_DEASSERT_DELAY    = 0b100,
-            p_TX_LOOPBACK_DRIVE_HIZ      = "FALSE",
-            p_TX_MAINCURSOR_SEL          = 0b0,
-            p_TX_DRIVE_MODE              = "DIRECT",
-            p_TX_MARGIN_FULL_0           = 0b1001110,
-            p_TX_MARGIN_FULL_1           = 0b1001001,
-            p_TX_MARGIN_FULL_2           = 0b1000101,
-            p_TX_MARGIN_FULL_3           = 0b1000010,
-            p_TX_MARGIN_FULL_4           = 0b1000000,
-            p_TX_MARGIN_LOW_0            = 0b1000110,
-            p_TX_MARGIN_LOW_1            = 0b1000100,
-            p_TX_MARGIN_LOW_2            = 0b1000010,
-            p_TX_MARGIN_LOW_3            = 0b1000000,
-            p_TX_MARGIN_LOW_4            = 0b1000000,
-
-            # TX Gearbox Attributes
-            p_TXGEARBOX_EN               = "FALSE",
-
-            # TX Initialization and Reset Attributes
-            p_TXPCSRESET_TIME            = 0b00001,
-            p_TXPMARESET_TIME            = 0b00001,
-
-            # TX Receiver Detection Attributes
-            p_TX_RXDETECT_CFG            = 0x1832,
-            p_TX_RXDETECT_REF            = 0b100,
-
-            # JTAG Attributes
-            p_ACJTAG_DEBUG_MODE          = 0b0,
-            p_ACJTAG_MODE                = 0b0,
-            p_ACJTAG_RESET               = 0b0,
-
-            # CDR Attributes
-            p_CFOK_CFG                   = 0x49000040E80,
-            p_CFOK_CFG2                  = 0b0100000,
-            p_CFOK_CFG3                  = 0b0100000,
-            p_CFOK_CFG4                  = 0b0,
-            p_CFOK_CFG5                  = 0x0,
-            p_CFOK_CFG6                  = 0b0000,
-            p_RXOSCALRESET_TIME          = 0b00011,
-            p_RXOSCALRESET_TIMEOUT       = 0b00000,
-
-            # PMA Attributes
-            p_CLK_COMMON_SWING           = 0b0,
-            p_RX_CLKMUX_EN               = 0b1,
-            p_TX_CLKMUX_EN               = 0b1,
-            p_ES_CLK_PHASE_SEL           = 0b0,
-            p_USE_PCS_CLK_PHASE_SEL      = 0b0,
-            p_PMA_RSV6                   = 0b0,
-            p_PMA_RSV7                   = 0b0,
-
-            # TX Configuration Driver Attributes
-            p_TX_PREDRIVER_MODE          = 0b0,
-            p_PMA_RSV5                   = 0b0,
-            p_SATA_PLL_CFG               = "VCO_3000MHZ",
-
-            # RX Fabric Clock Output Control Attributes
-            p_RXOUT_DIV                  = {1.25e9 : 4, 3.125e9 : 2}[self.linerate],
-
-            # TX Fabric Clock Output Control Attributes
-            p_TXOUT_DIV                  = {1.25e9 : 4, 3.125e9 : 2}[self.linerate],
-
-            # RX Phase Interpolator Attributes
-            p_RXPI_CFG0                  = 0b000,
-            p_RXPI_CFG1                  = 0b1,
-            p_RXPI_CFG2                  = 0b1,
-
-            # RX Equalizer Attributes
-            p_ADAPT_CFG0                 = 0x00000,
-            p_RXLPMRESET_TIME            = 0b0001111,
-            p_RXLPM_BIAS_STARTUP_DISABLE = 0b0,
-            p_RXLPM_CFG                  = 0b0110,
-            p_RXLPM_CFG1                 = 0b0,
-            p_RXLPM_CM_CFG               = 0b0,
-            p_RXLPM_GC_CFG               = 0b111100010,
-            p_RXLPM_GC_CFG2              = 0b001,
-            p_RXLPM_HF_CFG               = 0b00001111110000,
-            p_RXLPM_HF_CFG2              = 0b01010,
-            p_RXLPM_HF_CFG3              = 0b0000,
-            p_RXLPM_HOLD_DURING_EIDLE    = 0b0,
-            p_RXLPM_INCM_CFG             = 0b0,
-            p_RXLPM_IPCM_CFG             = 0b1,
-            p_RXLPM_LF_CFG               = 0b000000001111110000,
-            p_RXLPM_LF_CFG2              = 0b01010,
-            p_RXLPM_OSINT_CFG            = 0b100,
-
-            # TX Phase Interpolator PPM Controller Attributes
-            p_TXPI_CFG0                  = 0b00,
-            p_TXPI_CFG1                  = 0b00,
-            p_TXPI_CFG2                  = 0b00,
-            p_TXPI_CFG3                  = 0b0,
-            p_TXPI_CFG4                  = 0b0,
-            p_TXPI_CFG5                  = 0b000,
-            p_TXPI_GREY_SEL              = 0b0,
-            p_TXPI_INVSTROBE_SEL         = 0b0,
-            p_TXPI_PPMCLK_SEL            = "TXUSRCLK2",
-            p_TXPI_PPM_CFG               = 0x00,
-            p_TXPI_SYNFREQ_PPM           = 0b001,
-
-            # LOOPBACK Attributes
-            p_LOOPBACK_CFG               = 0b0,
-            p_PMA_LOOPBACK_CFG           = 0b0,
-
-            # RX OOB Signalling Attributes
-            p_RXOOB_CLK_CFG              = "PMA",
-
-            # TX OOB Signalling Attributes
-            p_TXOOB_CFG                  = 0b0,
-
-            # RX Buffer Attributes
-            p_RXSYNC_MULTILANE           = 0b0,
-            p_RXSYNC_OVRD                = 0b0,
-            p_RXSYNC_SKIP_DA             = 0b0,
-
-            # TX Buffer Attributes
-            p_TXSYNC_MULTILANE           = 0b0,
-            p_TXSYNC_OVRD                = 0b0,
-            p_TXSYNC_SKIP_DA             = 0b0
-        )
-        gtp_params.update(
+        gtp_io_params = dict(
             # CPLL Ports
             i_GTRSVD               = 0b0000000000000000,
             i_PCSRSVDIN            = 0b0000000000000000,
@@ -674,40 +685,39 @@ class A7_1000BASEX(LiteXModule):
             # Transmit Ports - pattern Generator Ports
             i_TXPRBSSEL            = 0
         )
-        if qpll_channel.index == 0:
-            gtp_params.update(
-                # Clocking Ports
-                i_RXSYSCLKSEL = 0b00,
-                i_TXSYSCLKSEL = 0b00,
-                # GTPE2_CHANNEL Clocking Ports
-                i_PLL0CLK     = qpll_channel.clk,
-                i_PLL0REFCLK  = qpll_channel.refclk,
-                i_PLL1CLK     = 0,
-                i_PLL1REFCLK  = 0,
-            )
-        elif qpll_channel.index == 1:
-            gtp_params.update(
-                # Clocking Ports
-                i_RXSYSCLKSEL = 0b11,
-                i_TXSYSCLKSEL = 0b11,
-                # GTPE2_CHANNEL Clocking Ports
-                i_PLL0CLK     = 0,
-                i_PLL0REFCLK  = 0,
-                i_PLL1CLK     = qpll_channel.clk,
-                i_PLL1REFCLK  = qpll_channel.refclk,
-            )
-        else:
+        # QPLL clocking ports, unused PLL inputs are tied to 0.
+        if qpll_channel.index not in [0, 1]:
             raise ValueError
+        pll_clk    = [0, 0]
+        pll_refclk = [0, 0]
+        pll_clk[qpll_channel.index]    = qpll_channel.clk
+        pll_refclk[qpll_channel.index] = qpll_channel.refclk
+        gtp_qpll_params = dict(
+            # Clocking Ports
+            i_RXSYSCLKSEL = [0b00, 0b11][qpll_channel.index],
+            i_TXSYSCLKSEL = [0b00, 0b11][qpll_channel.index],
+            # GTPE2_CHANNEL Clocking Ports
+            i_PLL0CLK     = pll_clk[0],
+            i_PLL0REFCLK  = pll_refclk[0],
+            i_PLL1CLK     = pll_clk[1],
+            i_PLL1REFCLK  = pll_refclk[1],
+        )
+        gtp_params = {
+            **_gtp_static_params,
+            **_gtp_linerate_params[self.linerate],
+            **gtp_io_params,
+            **gtp_qpll_params,
+        }
         self.specials += Instance("GTPE2_CHANNEL", **gtp_params)
 
         # Get 125MHz clocks back - the GTP is outputting 62.5MHz.
         txoutclk_rebuffer = Signal()
-        self.specials += Instance("BUFG",
+        self.specials += Instance(tx_rebuf_type,
             i_I = self.txoutclk,
             o_O = txoutclk_rebuffer
         )
         rxoutclk_rebuffer = Signal()
-        self.specials += Instance("BUFG",
+        self.specials += Instance(rx_rebuf_type,
             i_I = self.rxoutclk,
             o_O = rxoutclk_rebuffer
         )
@@ -13,7 +13,7 @@ from migen.fhdl.specials import Tristate
 
 # LiteEth PHY HWReset ------------------------------------------------------------------------------
 
-class LiteEthPHYHWReset(Module):
+class LiteEthPHYHWReset(LiteXModule):
     def __init__(self, cycles=256):
         self.reset = Signal()
 
@@ -32,7 +32,7 @@ class LiteEthPHYHWReset(Module):
 # LiteEth PHY MDIO ---------------------------------------------------------------------------------
 
 class LiteEthPHYMDIO(LiteXModule):
-    def __init__(self, pads):
+    def __init__(self, pads, with_hw_access=False, sys_clk_freq=None, mdc_freq=2.5e6):
         self._w = CSRStorage(fields=[
             CSRField("mdc", size=1),
             CSRField("oe",  size=1),
@@ -43,16 +43,106 @@ class LiteEthPHYMDIO(LiteXModule):
             CSRField("r", size=1)],
             name="r"
         )
+        if with_hw_access:
+            assert sys_clk_freq is not None
+            self._control = CSRStorage(fields=[
+                CSRField("start", size=1, offset=0,  pulse=True),
+                CSRField("read",  size=1, offset=1),
+                CSRField("phyad", size=5, offset=8),
+                CSRField("regad", size=5, offset=16)],
+                name="control"
+            )
+            self._wdata  = CSRStorage(16, name="wdata")
+            self._rdata  = CSRStatus(16,  name="rdata")
+            self._status = CSRStatus(fields=[
+                CSRField("done", size=1)],
+                name="status"
+            )
 
         # # #
 
         data_w  = Signal()
         data_oe = Signal()
         data_r  = Signal()
-        self.comb += [
+        bitbang = [
             pads.mdc.eq(self._w.storage[0]),
             data_oe.eq( self._w.storage[1]),
             data_w.eq(  self._w.storage[2]),
         ]
         self.specials += MultiReg(data_r, self._r.status[0])
         self.specials += Tristate(pads.mdio, data_w, data_oe, data_r)
+
+        if not with_hw_access:
+            self.comb += bitbang
+            return
+
+        # Clause 22 Frame (MSB first): Preamble / ST / OP / PHYAD / REGAD / TA / DATA.
+        read  = self._control.fields.read
+        frame = Signal(64)
+        self.comb += frame.eq(Cat(
+            self._wdata.storage,                 # DATA.
+            C(0b10, 2),                          # TA (Driven on writes only).
+            self._control.fields.regad,          # REGAD.
+            self._control.fields.phyad,          # PHYAD.
+            Mux(read, C(0b10, 2), C(0b01, 2)),   # OP.
+            C(0b01, 2),                          # ST.
+            Replicate(1, 32),                    # Preamble.
+        ))
+
+        # MDC Generation.
+        mdc_div  = max(ceil(sys_clk_freq/(2*mdc_freq)), 1)
+        # Read data is driven by the PHY after the MDC rising edge preceding its sampling edge and
+        # sampled from the MultiReg output on the next MDC rising edge: The PHY output delay (up to
+        # 300ns) and the 2 cycles of the MultiReg have to fit in one MDC period.
+        assert 2*mdc_div >= (ceil(300e-9*sys_clk_freq) + 2), "MDC frequency too high for MDIO reads."
+        mdc      = Signal()
+        mdc_cnt  = Signal(max=mdc_div)
+        mdc_tick = Signal()
+        mdc_rise = Signal()
+        mdc_fall = Signal()
+        self.comb += [
+            mdc_tick.eq(mdc_cnt == (mdc_div - 1)),
+            mdc_rise.eq(mdc_tick & ~mdc),
+            mdc_fall.eq(mdc_tick &  mdc),
+        ]
+
+        # FSM.
+        sr    = Signal(64)
+        count = Signal(max=64)
+        rdata = Signal(16)
+        self.comb += self._rdata.status.eq(rdata)
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self._status.fields.done.eq(1),
+            NextValue(mdc,     0),
+            NextValue(mdc_cnt, 0),
+            NextValue(count,   0),
+            NextValue(sr, frame),
+            If(self._control.fields.start,
+                NextState("XFER")
+            ),
+            *bitbang
+        )
+        fsm.act("XFER",
+            pads.mdc.eq(mdc),
+            # Release MDIO from TA onwards on reads.
+            data_oe.eq(~read | (count < (64 - 16 - 2))),
+            data_w.eq(sr[-1]),
+            NextValue(mdc_cnt, mdc_cnt + 1),
+            If(mdc_tick,
+                NextValue(mdc,     ~mdc),
+                NextValue(mdc_cnt, 0),
+            ),
+            # PHY samples MDIO on MDC rising edge; sample read data on the same edge.
+            If(mdc_rise & (count >= (64 - 16)),
+                NextValue(rdata, Cat(self._r.status[0], rdata)),
+            ),
+            # Shift next bit out on MDC falling edge.
+            If(mdc_fall,
+                NextValue(sr,    Cat(0, sr)),
+                NextValue(count, count + 1),
+                If(count == (64 - 1),
+                    NextState("IDLE")
+                )
+            )
+        )
@@ -89,10 +89,9 @@ class LiteEthPHYRGMIIRX(LiteXModule):
 
         rx_ctl_delayf  = Signal()
         rx_ctl         = Signal(2)
-        rx_ctl_reg     = Signal(2)
+        rx_ctl_reg     = Signal()
         rx_data_delayf = Signal(4)
         rx_data        = Signal(8)
-        rx_data_reg    = Signal(8)
 
         self.specials += [
             Instance("DELAYG",
@@ -108,7 +107,7 @@ class LiteEthPHYRGMIIRX(LiteXModule):
                 o2  = rx_ctl[1],
             )
         ]
-        self.sync += rx_ctl_reg.eq(rx_ctl)
+        self.sync += rx_ctl_reg.eq(rx_ctl[0])
         for i in range(4):
             self.specials += [
                 Instance("DELAYG",
@@ -123,16 +122,12 @@ class LiteEthPHYRGMIIRX(LiteXModule):
                     o2  = rx_data[i+4],
                 )
             ]
-        self.sync += rx_data_reg.eq(rx_data)
-
-        rx_ctl_reg_d = Signal(2)
-        self.sync += rx_ctl_reg_d.eq(rx_ctl_reg)
 
         last = Signal()
-        self.comb += last.eq(~rx_ctl_reg[0] & rx_ctl_reg_d[0])
+        self.comb += last.eq(~rx_ctl[0] & rx_ctl_reg)
         self.sync += [
-            source.valid.eq(rx_ctl_reg[0]),
-            source.data.eq(rx_data_reg)
+            source.valid.eq(rx_ctl[0]),
+            source.data.eq(rx_data)
         ]
         self.comb += source.last.eq(last)
 
@@ -148,7 +143,7 @@ class LiteEthPHYRGMIIRX(LiteXModule):
 # LiteEth PHY RGMII CRG ----------------------------------------------------------------------------
 
 class LiteEthPHYRGMIICRG(LiteXModule):
-    def __init__(self, clock_pads, pads, with_hw_init_reset, tx_delay=2e-9, tx_clk=None):
+    def __init__(self, clock_pads, pads, with_hw_init_reset, tx_delay=2e-9, tx_clk=None, tx_clk_90=None):
         self._reset = CSRStorage()
 
         # # #
@@ -164,13 +159,22 @@ class LiteEthPHYRGMIICRG(LiteXModule):
         else:
             self.comb += self.cd_eth_tx.clk.eq(self.cd_eth_rx.clk)
 
-        tx_delay_taps = int(tx_delay/25e-12) # 25ps per tap
-        assert tx_delay_taps < 128
+        # TX Clock Forwarding: From the 90-degree shifted tx_clk_90 when provided (tx_delay is then
+        # ignored and DELAYG is kept with a 0 delay to match TX Data/Ctl paths), else from eth_tx
+        # delayed by tx_delay.
+        if isinstance(tx_clk_90, Signal):
+            assert isinstance(tx_clk, Signal)
+            tx_clk_forward = tx_clk_90
+            tx_delay_taps  = 0
+        else:
+            tx_clk_forward = ClockSignal("eth_tx")
+            tx_delay_taps  = int(tx_delay/25e-12) # 25ps per tap
+            assert tx_delay_taps < 128
 
         eth_tx_clk_o = Signal()
         self.specials += [
             DDROutput(
-                clk = ClockSignal("eth_tx"),
+                clk = tx_clk_forward,
                 i1  = 1,
                 i2  = 0,
                 o   = eth_tx_clk_o,
@@ -207,11 +211,14 @@ class LiteEthPHYRGMII(LiteXModule):
         rx_delay           = 2e-9,
         with_inband_status = True,
         tx_clk             = None,
+        tx_clk_90          = None,
+        with_hw_mdio       = False,
+        sys_clk_freq       = None,
         ):
-        self.crg = LiteEthPHYRGMIICRG(clock_pads, pads, with_hw_init_reset, tx_delay, tx_clk)
+        self.crg = LiteEthPHYRGMIICRG(clock_pads, pads, with_hw_init_reset, tx_delay, tx_clk, tx_clk_90)
         self.tx  = ClockDomainsRenamer("eth_tx")(LiteEthPHYRGMIITX(pads))
         self.rx  = ClockDomainsRenamer("eth_rx")(LiteEthPHYRGMIIRX(pads, rx_delay, with_inband_status))
         self.sink, self.source = self.tx.sink, self.rx.source
 
         if hasattr(pads, "mdc"):
-            self.mdio = LiteEthPHYMDIO(pads)
+            self.mdio = LiteEthPHYMDIO(pads, with_hw_access=with_hw_mdio, sys_clk_freq=sys_clk_freq)
@@ -108,7 +108,7 @@ class LiteEthPHYGMII(LiteXModule):
     dw          = 8
     tx_clk_freq = 125e6
     rx_clk_freq = 125e6
-    def __init__(self, clock_pads, pads, with_hw_init_reset=True, model=False):
+    def __init__(self, clock_pads, pads, with_hw_init_reset=True, model=False, with_hw_mdio=False, sys_clk_freq=None):
         self.model = model
         self.crg   = LiteEthPHYGMIICRG(clock_pads, pads, with_hw_init_reset, model=model)
         self.tx    = ClockDomainsRenamer("eth_tx")(LiteEthPHYGMIITX(pads))
@@ -116,4 +116,4 @@ class LiteEthPHYGMII(LiteXModule):
         self.sink, self.source = self.tx.sink, self.rx.source
 
         if hasattr(pads, "mdc"):
-            self.mdio = LiteEthPHYMDIO(pads)
+            self.mdio = LiteEthPHYMDIO(pads, with_hw_access=with_hw_mdio, sys_clk_freq=sys_clk_freq)
@@ -174,7 +174,7 @@ class LiteEthPHYGMIIMII(LiteXModule):
     dw          = 8
     tx_clk_freq = 125e6
     rx_clk_freq = 125e6
-    def __init__(self, clock_pads, pads, clk_freq, with_hw_init_reset=True):
+    def __init__(self, clock_pads, pads, clk_freq, with_hw_init_reset=True, with_hw_mdio=False):
         # Note: we can use GMII CRG since it also handles tx clock pad used for MII
         self.mode_detection = LiteEthGMIIMIIModeDetection(clk_freq)
         mode = self.mode_detection.mode
@@ -184,4 +184,4 @@ class LiteEthPHYGMIIMII(LiteXModule):
         self.sink, self.source = self.tx.sink, self.rx.source
 
         if hasattr(pads, "mdc"):
-            self.mdio = LiteEthPHYMDIO(pads)
\ No newline at end of file
+            self.mdio = LiteEthPHYMDIO(pads, with_hw_access=with_hw_mdio, sys_clk_freq=clk_freq)
\ No newline at end of file
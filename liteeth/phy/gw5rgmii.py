@@ -205,6 +205,8 @@ class LiteEthPHYRGMII(LiteXModule):
         tx_delay           = 2e-9,
         rx_delay           = 2e-9,
         tx_clk             = None,
+        with_hw_mdio       = False,
+        sys_clk_freq       = None,
         ):
         self.crg = LiteEthPHYRGMIICRG(clock_pads, pads, with_hw_init_reset, tx_delay, tx_clk)
         self.tx  = ClockDomainsRenamer("eth_tx")(LiteEthPHYRGMIITX(pads))
@@ -212,4 +214,4 @@ class LiteEthPHYRGMII(LiteXModule):
         self.sink, self.source = self.tx.sink, self.rx.source
 
         if hasattr(pads, "mdc"):
-            self.mdio = LiteEthPHYMDIO(pads)
+            self.mdio = LiteEthPHYMDIO(pads, with_hw_access=with_hw_mdio, sys_clk_freq=sys_clk_freq)
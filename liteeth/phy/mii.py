@@ -96,11 +96,11 @@ class LiteEthPHYMII(LiteXModule):
     dw          = 8
     tx_clk_freq = 25e6
     rx_clk_freq = 25e6
-    def __init__(self, clock_pads, pads, with_hw_init_reset=True):
+    def __init__(self, clock_pads, pads, with_hw_init_reset=True, with_hw_mdio=False, sys_clk_freq=None):
         self.crg = LiteEthPHYMIICRG(clock_pads, pads, with_hw_init_reset)
         self.tx  = ClockDomainsRenamer("eth_tx")(LiteEthPHYMIITX(pads))
         self.rx  = ClockDomainsRenamer("eth_rx")(LiteEthPHYMIIRX(pads))
         self.sink, self.source = self.tx.sink, self.rx.source
 
         if hasattr(pads, "mdc"):
-            self.mdio = LiteEthPHYMDIO(pads)
+            self.mdio = LiteEthPHYMDIO(pads, with_hw_access=with_hw_mdio, sys_clk_freq=sys_clk_freq)
@@ -197,7 +197,9 @@ class LiteEthPHYRMII(LiteXModule):
     rx_clk_freq = 50e6
     def __init__(self, clock_pads, pads, refclk_cd="eth", default_speed=1,
         with_hw_init_reset     = True,
-        with_refclk_ddr_output = True):
+        with_refclk_ddr_output = True,
+        with_hw_mdio           = False,
+        sys_clk_freq           = None):
 
         # CRG.
         # ----
@@ -229,4 +231,4 @@ class LiteEthPHYRMII(LiteXModule):
         # MDIO.
         # -----
         if hasattr(pads, "mdc"):
-            self.mdio = LiteEthPHYMDIO(pads)
+            self.mdio = LiteEthPHYMDIO(pads, with_hw_access=with_hw_mdio, sys_clk_freq=sys_clk_freq)
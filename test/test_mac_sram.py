@@ -0,0 +1,761 @@
+#
+# This file is part of LiteEth.
+#
+# Copyright (c) 2026 agent <agent@local>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+import math
+import random
+
+from migen import *
+
+from litex.gen import *
+from litex.gen.sim import *
+
+from liteeth.common import *
+from liteeth.mac.wishbone import LiteEthMACWishboneInterface
+
+from litex.soc.interconnect import wishbone
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def wishbone_write(bus, adr, dat):
+    yield bus.cyc.eq(1)
+    yield bus.stb.eq(1)
+    yield bus.adr.eq(adr)
+    yield bus.we.eq(1)
+    yield bus.sel.eq(2**len(bus.sel) - 1)
+    yield bus.dat_w.eq(dat)
+    yield
+    while not (yield bus.ack):
+        yield
+    yield bus.cyc.eq(0)
+    yield bus.stb.eq(0)
+    yield
+
+def wishbone_read(bus, adr):
+    yield bus.cyc.eq(1)
+    yield bus.stb.eq(1)
+    yield bus.adr.eq(adr)
+    yield bus.we.eq(0)
+    yield bus.sel.eq(2**len(bus.sel) - 1)
+    yield
+    while not (yield bus.ack):
+        yield
+    dat = (yield bus.dat_r)
+    yield bus.cyc.eq(0)
+    yield bus.stb.eq(0)
+    yield
+    return dat
+
+def bytes_to_words(data, bytes_per_word, byteorder):
+    words = []
+    for i in range(0, len(data), bytes_per_word):
+        chunk = data[i:i + bytes_per_word]
+        chunk = chunk + [0]*(bytes_per_word - len(chunk))
+        words.append(int.from_bytes(bytes(chunk), byteorder))
+    return words
+
+def random_packets(npackets, lengths=[1, 3, 7, 60, 61, 62, 63, 64, 150]):
+    lengths = [random.choice(lengths) for _ in range(npackets)]
+    return [[random.randrange(256) for _ in range(length)] for length in lengths]
+
+def phy_rx_generator(sink, packets, bytes_per_word, wait=None, errors=None):
+    # Send packets on the sink (PHY side), optionally waiting between packets and with an error on
+    # the last byte of the packets flagged in errors.
+    for n, packet in enumerate(packets):
+        words = bytes_to_words(packet, bytes_per_word, "little")
+        for i, word in enumerate(words):
+            last    = (i == len(words) - 1)
+            last_be = 2**((len(packet) - 1)%bytes_per_word) if last else 0
+            yield sink.valid.eq(1)
+            yield sink.data.eq(word)
+            yield sink.last.eq(last)
+            yield sink.last_be.eq(last_be)
+            yield sink.error.eq(last_be if (errors is not None and errors[n]) else 0)
+            yield
+            while not (yield sink.ready):
+                yield
+        yield sink.valid.eq(0)
+        if wait is not None:
+            yield from wait(n)
+
+def phy_tx_generator(source, npackets, bytes_per_word, packets, random_ready=True, gaps=None):
+    # Receive packets on the source (PHY side), optionally recording the idle cycles between them.
+    data = []
+    while len(packets) < npackets:
+        yield source.ready.eq((random.randrange(4) != 0) if random_ready else 1)
+        yield
+        if (yield source.valid) and (yield source.ready):
+            data += list((yield source.data).to_bytes(bytes_per_word, "little"))
+            if (yield source.last):
+                last_be = (yield source.last_be)
+                data = data[:len(data) - bytes_per_word + max(last_be.bit_length(), 1)]
+                packets.append(data)
+                data = []
+        elif gaps is not None and len(packets):
+            gaps.append(len(packets))
+
+def rx_slot_read(bus, writer, bytes_per_word, endianness, nbytes=None):
+    # Read the oldest available Slot (optionally nbytes of it) and release it (CPU side).
+    slot   = (yield writer._slot.status)
+    length = (yield writer._length.status)
+    nbytes = length if nbytes is None else nbytes
+    data   = []
+    for i in range((nbytes + bytes_per_word - 1)//bytes_per_word):
+        word  = yield from wishbone_read(bus, slot*writer.slot_words + i)
+        data += list(word.to_bytes(bytes_per_word, endianness))
+    yield from event_clear(writer.ev)
+    return length, data[:nbytes]
+
+@passive
+def sink_stall_checker(sink, stalls):
+    # Record the cycles where the sink (PHY side) is stalled.
+    cycle = 0
+    while True:
+        if (yield sink.valid) and not (yield sink.ready):
+            stalls.append(cycle)
+        cycle += 1
+        yield
+
+@passive
+def timeout_generator(cycles=100000):
+    for i in range(cycles):
+        yield
+    raise TimeoutError
+
+class TimestampDUT(LiteXModule):
+    def __init__(self, dw, nslots):
+        # Free-running Timestamp (in cycles).
+        self.timestamp = Signal(64)
+        self.sync += self.timestamp.eq(self.timestamp + 1)
+        self.interface = LiteEthMACWishboneInterface(dw, nslots, nslots, "big", timestamp=self.timestamp)
+
+def event_clear(ev):
+    yield ev.pending.re.eq(1)
+    yield ev.pending.r.eq(1)
+    yield
+    yield ev.pending.re.eq(0)
+    yield ev.pending.r.eq(0)
+    yield
+
+# Test MAC SRAM ------------------------------------------------------------------------------------
+
+class TestMACSRAM(unittest.TestCase):
+    def sram_test(self, dw, nslots, endianness, npackets=4, with_rx_descriptor=False):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut = LiteEthMACWishboneInterface(dw, nslots, nslots, endianness,
+            with_rx_descriptor = with_rx_descriptor,
+        )
+        rx_slot_words = dut.sram.writer.slot_words
+        tx_slot_words = dut.sram.reader.slot_words
+
+        packets    = random_packets(npackets)
+        rx_packets = []
+        tx_packets = []
+        rx_stalls  = []
+
+        def rx_wait(n):
+            # Wait for a free slot.
+            while len(rx_packets) < (n + 2 - nslots):
+                yield
+
+        def rx_software_generator():
+            # Retrieve packets from the Writer slots (CPU side).
+            writer = dut.sram.writer
+            for n in range(npackets):
+                while not (yield writer.ev.available.status):
+                    yield
+                slot   = (yield writer._slot.status)
+                length = (yield writer._length.status)
+                offset = 0
+                data   = []
+                if with_rx_descriptor:
+                    descriptor = yield from wishbone_read(dut.bus_rx, slot*rx_slot_words)
+                    self.assertEqual(descriptor & 0xffff, length)
+                    offset = 1
+                for i in range((length + bytes_per_word - 1)//bytes_per_word):
+                    word = yield from wishbone_read(dut.bus_rx, slot*rx_slot_words + offset + i)
+                    data += list(word.to_bytes(bytes_per_word, endianness))
+                rx_packets.append(data[:length])
+                yield writer.ev.pending.re.eq(1)
+                yield writer.ev.pending.r.eq(1)
+                yield
+                yield writer.ev.pending.re.eq(0)
+                yield writer.ev.pending.r.eq(0)
+                yield
+
+        def tx_software_generator():
+            # Fill the Reader slots and start transmission (CPU side).
+            reader = dut.sram.reader
+            for n, packet in enumerate(packets):
+                slot = n%nslots
+                for i, word in enumerate(bytes_to_words(packet, bytes_per_word, endianness)):
+                    yield from wishbone_write(dut.bus_tx, slot*tx_slot_words + i, word)
+                while not (yield reader._ready.status):
+                    yield
+                yield reader._slot.storage.eq(slot)
+                yield reader._length.storage.eq(len(packet))
+                yield reader._start.re.eq(1)
+                yield
+                yield reader._start.re.eq(0)
+                # Wait for packet to be sent before re-using the slot.
+                while len(tx_packets) < (n + 1):
+                    yield
+
+        generators = [
+            phy_rx_generator(dut.sink, packets, bytes_per_word, wait=rx_wait),
+            rx_software_generator(),
+            tx_software_generator(),
+            phy_tx_generator(dut.source, npackets, bytes_per_word, tx_packets),
+            sink_stall_checker(dut.sink, rx_stalls),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(rx_packets, packets)
+        self.assertEqual(tx_packets, packets)
+        # Sink is never stalled (including between back-to-back packets).
+        self.assertEqual(rx_stalls, [])
+
+    def sram_rx_test(self, dw, packets, expected, errors=None, nslots=2):
+        bytes_per_word = dw//8
+        assert len(expected) <= nslots # Expected packets are all stored without dropping.
+
+        dut    = LiteEthMACWishboneInterface(dw, nslots, nslots, "little")
+        writer = dut.sram.writer
+
+        rx_packets = []
+
+        def rx_software_generator():
+            for n in range(len(expected)):
+                while not (yield writer.ev.available.status):
+                    yield
+                length, data = yield from rx_slot_read(dut.bus_rx, writer, bytes_per_word, "little")
+                self.assertEqual(length, len(data))
+                rx_packets.append(data)
+            self.assertEqual((yield writer._errors.status), 0)
+
+        generators = [
+            phy_rx_generator(dut.sink, packets, bytes_per_word, errors=errors),
+            rx_software_generator(),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(rx_packets, expected)
+
+    def sram_rx_truncate_test(self, dw):
+        random.seed(0)
+        # Packets longer than eth_mtu are truncated to the Slot size: eth_mtu rounded up to words
+        # and the overshoot word written before the registered MTU check terminates the packet.
+        packets   = random_packets(2, lengths=[eth_mtu + 100])
+        truncated = (math.ceil(eth_mtu/(dw//8)) + 1)*(dw//8)
+        self.sram_rx_test(dw, packets, expected=[packets[0][:truncated], packets[1][:truncated]])
+        # Packet following a truncated packet is intact.
+        packets = [random_packets(1, lengths=[eth_mtu + 100])[0], random_packets(1)[0]]
+        self.sram_rx_test(dw, packets, expected=[packets[0][:truncated], packets[1]])
+
+    def sram_rx_error_test(self, dw):
+        random.seed(0)
+        # Packets with an error on the last byte are discarded, following packets are intact.
+        packets = random_packets(4, lengths=[61, 62, 63, 64])
+        self.sram_rx_test(dw, packets, expected=[packets[0], packets[3]], errors=[0, 1, 1, 0])
+
+    def sram_rx_drop_test(self, dw, nslots):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut    = LiteEthMACWishboneInterface(dw, nslots, nslots, "little")
+        writer = dut.sram.writer
+
+        # nslots packets filling the Slots, a single word packet dropped (its first word being
+        # the last one) and a packet sent once a Slot has been released.
+        packets    = random_packets(nslots, lengths=[64]) + [[0x5a]] + random_packets(1, lengths=[61])
+        rx_packets = []
+
+        def rx_wait(n):
+            # Wait for a Slot to be released after the dropped packet.
+            while (n == nslots) and (len(rx_packets) < 1):
+                yield
+
+        def rx_software_generator():
+            while (yield writer._errors.status) < 1:
+                yield
+            while len(rx_packets) < (nslots + 1):
+                while not (yield writer.ev.available.status):
+                    yield
+                length, data = yield from rx_slot_read(dut.bus_rx, writer, bytes_per_word, "little")
+                rx_packets.append(data)
+            self.assertEqual((yield writer._errors.status), 1)
+
+        generators = [
+            phy_rx_generator(dut.sink, packets, bytes_per_word, wait=rx_wait),
+            rx_software_generator(),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(rx_packets, packets[:nslots] + packets[nslots + 1:])
+
+    def sram_rx_last_be_test(self, dw, endianness):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut    = LiteEthMACWishboneInterface(dw, 1, 1, endianness)
+        writer = dut.sram.writer
+
+        # Fill the Slot with a long packet, then receive shorter packets ending with a partial word.
+        lengths    = [4*bytes_per_word + i for i in range(1, bytes_per_word)]
+        packets    = random_packets(1, lengths=[8*bytes_per_word])
+        packets   += [random_packets(1, lengths=[length])[0] for length in lengths]
+        rx_packets = []
+
+        def rx_wait(n):
+            # Wait for the Slot to be released.
+            while len(rx_packets) < (n + 1):
+                yield
+
+        def rx_software_generator():
+            for n in range(len(packets)):
+                while not (yield writer.ev.available.status):
+                    yield
+                length, data = yield from rx_slot_read(dut.bus_rx, writer, bytes_per_word, endianness,
+                    nbytes = 5*bytes_per_word)
+                self.assertEqual(length, len(packets[n]))
+                rx_packets.append(data)
+
+        generators = [
+            phy_rx_generator(dut.sink, packets, bytes_per_word, wait=rx_wait),
+            rx_software_generator(),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        # Bytes after the last valid byte of the partial last word are not written and keep the
+        # contents of the first packet.
+        for n, length in enumerate(lengths):
+            self.assertEqual(rx_packets[n + 1], packets[n + 1] + packets[0][length:5*bytes_per_word])
+
+    def sram_rx_dma_test(self, dw, npackets, ring_size, lengths=[1, 3, 7, 60, 61, 62, 63, 64, 150]):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        class DUT(LiteXModule):
+            def __init__(self):
+                self.interface = LiteEthMACWishboneInterface(dw, 2, 2, "little", with_rx_dma=True)
+                entry_size     = self.interface.sram.writer.slot_words*bytes_per_word
+                self.ram       = wishbone.SRAM(ring_size*entry_size, bus=self.interface.rx_dma.bus)
+        dut = DUT()
+        dma = dut.interface.rx_dma
+        entry_words = dut.interface.sram.writer.slot_words
+
+        packets    = random_packets(npackets, lengths)
+        rx_packets = []
+
+        def rx_wait(n):
+            # Avoid Slot overflow.
+            while (yield dut.interface.sram.writer.ev.available.status):
+                yield
+
+        def rx_software_generator():
+            # Retrieve packets from the DMA Ring (CPU side).
+            # DMA is held in IDLE while ring_size is not set.
+            yield dma._enable.storage.eq(1)
+            for i in range(256):
+                yield
+            self.assertEqual((yield dma._head.status), 0)
+            yield dma._ring_size.storage.eq(ring_size)
+            tail = 0
+            while len(rx_packets) < npackets:
+                if (yield dma._head.status) == tail:
+                    yield
+                    continue
+                mem    = dut.ram.mem
+                length = (yield mem[tail*entry_words])
+                data   = []
+                for i in range((length + bytes_per_word - 1)//bytes_per_word):
+                    data += list((yield mem[tail*entry_words + 1 + i]).to_bytes(bytes_per_word, "little"))
+                rx_packets.append(data[:length])
+                tail = (tail + 1)%ring_size
+                yield dma._tail.storage.eq(tail)
+                yield
+
+        generators = [
+            phy_rx_generator(dut.interface.sink, packets, bytes_per_word, wait=rx_wait),
+            rx_software_generator(),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(rx_packets, packets)
+
+    def sram_bypass_test(self, dw, npackets):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut = LiteEthMACWishboneInterface(dw, 2, 2, "big", with_bypass=True)
+
+        packets    = random_packets(npackets)
+        tx_packets = []
+
+        def bypass_generator():
+            # Enable Bypass before sending packets.
+            yield dut.sram._bypass.storage.eq(1)
+            yield
+            yield from phy_rx_generator(dut.sink, packets, bytes_per_word)
+
+        generators = [
+            bypass_generator(),
+            phy_tx_generator(dut.source, npackets, bytes_per_word, tx_packets),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(tx_packets, packets)
+
+    def sram_bypass_drop_test(self, dw, npackets, length, bypass_depth=None, naccepted=2):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut = LiteEthMACWishboneInterface(dw, 2, 2, "big", with_bypass=True, bypass_depth=bypass_depth)
+        self.assertEqual(dut.sram.bypass_fifo.depth, bypass_depth or 2*math.ceil(eth_mtu/bytes_per_word))
+
+        packets    = [[random.randrange(256) for _ in range(length)] for _ in range(npackets)]
+        tx_packets = []
+        ready      = []
+
+        def bypass_generator():
+            # Enable Bypass and send packets while the output is stalled.
+            yield dut.sram._bypass.storage.eq(1)
+            yield
+            yield from phy_rx_generator(dut.sink, packets, bytes_per_word)
+
+        def ready_checker():
+            # Sink is never stalled, packets without room in the FIFO are dropped.
+            for i in range(npackets*length//bytes_per_word):
+                ready.append((yield dut.sink.ready))
+                yield
+
+        def phy_generator():
+            while (yield dut.sram.writer._errors.status) < npackets - naccepted:
+                yield
+            yield from phy_tx_generator(dut.source, naccepted, bytes_per_word, tx_packets)
+            self.assertEqual((yield dut.sram.writer._errors.status), npackets - naccepted)
+
+        generators = [
+            bypass_generator(),
+            ready_checker(),
+            phy_generator(),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(set(ready), {1})
+        self.assertEqual(tx_packets, packets[:naccepted])
+
+    def sram_rx_timestamp_test(self, dw, nslots, npackets):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut    = TimestampDUT(dw, nslots)
+        writer = dut.interface.sram.writer
+        sink   = dut.interface.sink
+
+        packets    = random_packets(npackets)
+        timestamps = []
+
+        @passive
+        def timestamp_monitor():
+            # Timestamp is stored on the first accepted word of the packet.
+            first = True
+            while True:
+                if (yield sink.valid) and (yield sink.ready):
+                    if first:
+                        timestamps.append((yield dut.timestamp))
+                    first = (yield sink.last)
+                yield
+
+        def rx_software_generator():
+            # Wait for all packets to be received before releasing the Slots: packets after nslots
+            # are dropped and must not corrupt the stored Timestamps.
+            while (yield writer._errors.status) < (npackets - nslots):
+                yield
+            for n in range(nslots):
+                self.assertEqual((yield writer.ev.available.status), 1)
+                self.assertEqual((yield writer._slot.status), n)
+                self.assertEqual((yield writer._timestamp.status), timestamps[n])
+                yield from event_clear(writer.ev)
+            self.assertEqual((yield writer.ev.available.status), 0)
+
+        generators = [
+            phy_rx_generator(sink, packets, bytes_per_word),
+            rx_software_generator(),
+            timestamp_monitor(),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(len(set(timestamps)), npackets)
+
+    def sram_tx_timestamp_test(self, dw, nslots, npackets, clear):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut    = TimestampDUT(dw, nslots)
+        reader = dut.interface.sram.reader
+        source = dut.interface.source
+        slot_words = reader.slot_words
+
+        packets    = random_packets(npackets)
+        tx_packets = []
+        timestamps = []
+
+        @passive
+        def timestamp_monitor():
+            # Timestamp is latched in the cycle preceding the first word of the packet.
+            first = True
+            while True:
+                if (yield source.valid) and first:
+                    timestamps.append((yield dut.timestamp) - 1)
+                    first = False
+                if (yield source.valid) and (yield source.ready) and (yield source.last):
+                    first = True
+                yield
+
+        def check_status(n):
+            # Oldest Status is presented until cleared, with a level-sensitive done event.
+            self.assertEqual((yield reader.ev.done.pending), 1)
+            self.assertEqual((yield reader._timestamp_slot.status), n%nslots)
+            self.assertEqual((yield reader._timestamp.status), timestamps[n])
+
+        def tx_software_generator():
+            # Send packets (CPU side), releasing the TX Status of each packet when clear is set.
+            for n, packet in enumerate(packets):
+                slot = n%nslots
+                for i, word in enumerate(bytes_to_words(packet, bytes_per_word, "big")):
+                    yield from wishbone_write(dut.interface.bus_tx, slot*slot_words + i, word)
+                yield reader._slot.storage.eq(slot)
+                yield reader._length.storage.eq(len(packet))
+                yield reader._start.re.eq(1)
+                yield
+                yield reader._start.re.eq(0)
+                while len(tx_packets) < (n + 1):
+                    yield
+                for i in range(8):
+                    yield
+                if clear:
+                    yield from check_status(n)
+                    yield from event_clear(reader.ev)
+                    self.assertEqual((yield reader.ev.done.pending), 0)
+            if not clear:
+                # Status Ring is full: Statuses of the first nslots packets are kept (others are
+                # lost) and the done event stays pending until all of them are cleared.
+                for n in range(nslots):
+                    yield from check_status(n)
+                    yield from event_clear(reader.ev)
+                self.assertEqual((yield reader.ev.done.pending), 0)
+
+        generators = [
+            tx_software_generator(),
+            phy_tx_generator(source, npackets, bytes_per_word, tx_packets),
+            timestamp_monitor(),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(tx_packets, packets)
+        self.assertEqual(len(set(timestamps)), npackets)
+
+    def sram_tx_burst_test(self, dw, nslots):
+        random.seed(0)
+        bytes_per_word = dw//8
+
+        dut = LiteEthMACWishboneInterface(dw, nslots, nslots, "big")
+        slot_words = dut.sram.reader.slot_words
+
+        packets    = random_packets(nslots)
+        tx_packets = []
+        tx_gaps    = []
+
+        def tx_software_generator():
+            # Fill all the Reader slots then queue all the commands (CPU side).
+            reader = dut.sram.reader
+            for slot, packet in enumerate(packets):
+                for i, word in enumerate(bytes_to_words(packet, bytes_per_word, "big")):
+                    yield from wishbone_write(dut.bus_tx, slot*slot_words + i, word)
+            for slot, packet in enumerate(packets):
+                self.assertEqual((yield reader._ready.status), 1)
+                yield reader._slot.storage.eq(slot)
+                yield reader._length.storage.eq(len(packet))
+                yield reader._start.re.eq(1)
+                yield
+                yield reader._start.re.eq(0)
+            self.assertEqual((yield reader._level.status), nslots - 1)
+
+        generators = [
+            tx_software_generator(),
+            phy_tx_generator(dut.source, nslots, bytes_per_word, tx_packets, random_ready=False, gaps=tx_gaps),
+            timeout_generator(),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(tx_packets, packets)
+        # Packets are sent back-to-back with a single cycle gap between them.
+        self.assertEqual(tx_gaps, list(range(1, nslots)))
+
+    def sram_rx_burst_test(self, dw, length):
+        random.seed(0)
+        bytes_per_word = dw//8
+        nwords         = length//bytes_per_word
+
+        dut = LiteEthMACWishboneInterface(dw, 2, 2, "little", with_burst=True)
+        slot_words = dut.sram.writer.slot_words
+
+        packet    = [random.randrange(256) for _ in range(length)]
+        rx_data   = []
+        rx_cycles = []
+
+        def rx_software_generator():
+            # Read packet from Slot with an incrementing burst (CPU side).
+            writer = dut.sram.writer
+            while not (yield writer.ev.available.status):
+                yield
+            self.assertEqual((yield writer._length.status), length)
+            bus = dut.bus_rx
+            yield bus.cyc.eq(1)
+            yield bus.stb.eq(1)
+            yield bus.we.eq(0)
+            yield bus.sel.eq(2**len(bus.sel) - 1)
+            yield bus.adr.eq((yield writer._slot.status)*slot_words)
+            yield bus.cti.eq(wishbone.CTI_BURST_INCREMENTING)
+            cycles = 0
+            while len(rx_data) < nwords:
+                yield
+                cycles += 1
+                if (yield bus.ack):
+                    rx_data.append((yield bus.dat_r))
+                    yield bus.adr.eq((yield bus.adr) + 1)
+                    if len(rx_data) == nwords - 1:
+                        yield bus.cti.eq(wishbone.CTI_BURST_END)
+            yield bus.cyc.eq(0)
+            yield bus.stb.eq(0)
+            rx_cycles.append(cycles)
+
+        generators = [
+            phy_rx_generator(dut.sink, [packet], bytes_per_word),
+            rx_software_generator(),
+            timeout_generator(10000),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(rx_data, bytes_to_words(packet, bytes_per_word, "little"))
+        # One word per cycle after the initial access.
+        self.assertEqual(rx_cycles, [nwords + 1])
+
+    def sram_shared_bus_test(self, dw, length):
+        random.seed(0)
+        bytes_per_word = dw//8
+        nwords         = length//bytes_per_word
+
+        dut = LiteEthMACWishboneInterface(dw, 2, 2, "little", with_shared_bus=True)
+        # Only the shared bus is exposed.
+        self.assertFalse(hasattr(dut, "bus_rx") or hasattr(dut, "bus_tx"))
+        tx_offset  = 2**bits_for(dut.sram.writer.mems[0].depth - 1)
+        slot_words = dut.sram.reader.slot_words
+
+        packet  = [random.randrange(256) for _ in range(length)]
+        words   = bytes_to_words(packet, bytes_per_word, "little")
+        rx_data = []
+        tx_data = []
+
+        def software_generator():
+            # Read RX Slot 0 and write TX Slot 1 through the shared bus (CPU side).
+            while not (yield dut.sram.writer.ev.available.status):
+                yield
+            for i in range(nwords):
+                rx_data.append((yield from wishbone_read(dut.bus, i)))
+            for i, word in enumerate(words):
+                yield from wishbone_write(dut.bus, tx_offset + slot_words + i, word)
+            for i in range(nwords):
+                tx_data.append((yield dut.sram.reader.mems[0][slot_words + i]))
+
+        generators = [
+            phy_rx_generator(dut.sink, [packet], bytes_per_word),
+            software_generator(),
+            timeout_generator(10000),
+        ]
+        run_simulation(dut, generators)
+        self.assertEqual(rx_data, words)
+        self.assertEqual(tx_data, words)
+
+    def test_sram_8b_2slots(self):
+        self.sram_test(dw=8, nslots=2, endianness="big")
+
+    def test_sram_32b_1slot(self):
+        self.sram_test(dw=32, nslots=1, endianness="big")
+
+    def test_sram_32b_4slots_little(self):
+        self.sram_test(dw=32, nslots=4, endianness="little")
+
+    def test_sram_64b_2slots(self):
+        self.sram_test(dw=64, nslots=2, endianness="big")
+
+    def test_sram_128b_2slots_little(self):
+        self.sram_test(dw=128, nslots=2, endianness="little")
+
+    def test_sram_32b_2slots_rx_descriptor(self):
+        self.sram_test(dw=32, nslots=2, endianness="big", with_rx_descriptor=True)
+
+    def test_sram_rx_truncate_8b(self):
+        self.sram_rx_truncate_test(dw=8)
+
+    def test_sram_rx_truncate_32b(self):
+        self.sram_rx_truncate_test(dw=32)
+
+    def test_sram_rx_truncate_64b(self):
+        self.sram_rx_truncate_test(dw=64)
+
+    def test_sram_rx_error(self):
+        self.sram_rx_error_test(dw=32)
+
+    def test_sram_rx_drop(self):
+        self.sram_rx_drop_test(dw=32, nslots=2)
+
+    def test_sram_rx_last_be(self):
+        self.sram_rx_last_be_test(dw=32, endianness="big")
+
+    def test_sram_rx_last_be_64b_little(self):
+        self.sram_rx_last_be_test(dw=64, endianness="little")
+
+    def test_sram_rx_dma(self):
+        self.sram_rx_dma_test(dw=32, npackets=6, ring_size=4)
+
+    def test_sram_rx_dma_8b(self):
+        # Packet Length (up to eth_mtu) does not fit in a 8-bit Ring entry word.
+        with self.assertRaises(AssertionError):
+            LiteEthMACWishboneInterface(8, 2, 2, "little", with_rx_dma=True)
+
+    def test_sram_rx_dma_16b(self):
+        # Lengths over 255 bytes to check the full Length is written in the Ring entry.
+        self.sram_rx_dma_test(dw=16, npackets=6, ring_size=4, lengths=[61, 300, 600])
+
+    def test_sram_bypass(self):
+        self.sram_bypass_test(dw=32, npackets=4)
+
+    def test_sram_bypass_drop(self):
+        self.sram_bypass_drop_test(dw=32, npackets=4, length=1500)
+
+    def test_sram_bypass_drop_1_mtu(self):
+        # FIFO only holds a single MTU packet: Packets are dropped until it is fully sent.
+        self.sram_bypass_drop_test(dw=32, npackets=4, length=1500, bypass_depth=383, naccepted=1)
+
+    def test_sram_rx_timestamp(self):
+        self.sram_rx_timestamp_test(dw=32, nslots=2, npackets=3)
+
+    def test_sram_tx_timestamp(self):
+        self.sram_tx_timestamp_test(dw=32, nslots=2, npackets=4, clear=True)
+
+    def test_sram_tx_timestamp_full(self):
+        self.sram_tx_timestamp_test(dw=32, nslots=2, npackets=4, clear=False)
+
+    def test_sram_tx_burst(self):
+        self.sram_tx_burst_test(dw=32, nslots=4)
+
+    def test_sram_rx_burst(self):
+        self.sram_rx_burst_test(dw=32, length=64)
+
+    def test_sram_shared_bus(self):
+        self.sram_shared_bus_test(dw=32, length=16)
@@ -0,0 +1,80 @@
+#
+# This file is part of LiteEth.
+#
+# Copyright (c) 2026 agent <agent@local>
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from migen import *
+from migen.fhdl.specials import Tristate
+
+from liteeth.phy.common import LiteEthPHYMDIO
+
+# Helpers ------------------------------------------------------------------------------------------
+
+class MDIOPads:
+    def __init__(self):
+        self.mdc  = Signal()
+        self.mdio = Signal()
+
+def mdio_dut():
+    pads = MDIOPads()
+    dut  = LiteEthPHYMDIO(pads, with_hw_access=True, sys_clk_freq=20e6, mdc_freq=2.5e6)
+    # Tristate can't be simulated, expose its o/oe/i to the PHY model instead.
+    tristate, = [s for s in dut._fragment.specials if isinstance(s, Tristate)]
+    dut._fragment.specials.remove(tristate)
+    return dut, pads, tristate
+
+def mdio_frame(read, phyad, regad, data):
+    bits  = [1]*32 + [0, 1] + ([1, 0] if read else [0, 1])
+    bits += [(phyad >> (4 - i)) & 1 for i in range(5)]
+    bits += [(regad >> (4 - i)) & 1 for i in range(5)]
+    bits += [1, 0]
+    bits += [(data >> (15 - i)) & 1 for i in range(16)]
+    return bits
+
+def mdio_phy_model(pads, tristate, bits, rdata=None):
+    mdc = 0
+    while len(bits) < 64:
+        if (yield pads.mdc) and not mdc:
+            bits.append((yield tristate.o) if (yield tristate.oe) else None)
+            # Drive read data after the rising edge preceding its sampling edge.
+            n = len(bits) - 48
+            if rdata is not None and 0 <= n < 16:
+                yield tristate.i.eq((rdata >> (15 - n)) & 1)
+        mdc = (yield pads.mdc)
+        yield
+
+# Test MDIO ----------------------------------------------------------------------------------------
+
+class TestMDIO(unittest.TestCase):
+    def mdio_test(self, read, phyad, regad, data):
+        dut, pads, tristate = mdio_dut()
+        bits = []
+
+        def generator():
+            self.assertEqual((yield dut._status.fields.done), 1)
+            yield from dut._wdata.write(0 if read else data)
+            yield from dut._control.write(1 | (read << 1) | (phyad << 8) | (regad << 16))
+            yield
+            self.assertEqual((yield dut._status.fields.done), 0)
+            while not (yield dut._status.fields.done):
+                yield
+            if read:
+                self.assertEqual((yield dut._rdata.status), data)
+
+        run_simulation(dut, [generator(), mdio_phy_model(pads, tristate, bits, data if read else None)])
+        expected = mdio_frame(read, phyad, regad, data)
+        if read:
+            # MDIO released from TA onwards.
+            self.assertEqual(bits[:46], expected[:46])
+            self.assertEqual(bits[46:], [None]*18)
+        else:
+            self.assertEqual(bits, expected)
+
+    def test_mdio_write(self):
+        self.mdio_test(read=0, phyad=0x05, regad=0x1a, data=0xa5c3)
+
+    def test_mdio_read(self):
+        self.mdio_test(read=1, phyad=0x13, regad=0x02, data=0xb35a)